@@ -3,44 +3,49 @@ An official Python implementation exists, which is more comprehensive, as well a
 complex: https://github.com/alexa/alexa-apis-for-python/blob/master/ask-smapi-model/ask_smapi_model/v1/skill/interaction_model/language_model.py
 """
 from enum import Enum
-from typing import List, Union
+from typing import List
 from dataclasses import dataclass, field
 
-from intents.helpers.data_classes import OmitNone
-from intents.connectors._experimental.alexa.slot_types import SystemSlotTypes
+from intents.helpers.data_classes import OmitNone, fast_dict, DATACLASS_SLOTS
 
 #
 # Language Model
 #
 
-@dataclass
+@fast_dict
+@dataclass(**DATACLASS_SLOTS)
 class LanguageModelIntentSlotMultipleValues:
     enabled: bool
 
-@dataclass
+@fast_dict
+@dataclass(**DATACLASS_SLOTS)
 class LanguageModelIntentSlot:
     name: str
-    type: Union[SystemSlotTypes, str]
+    type: str # Slot type name, e.g. `SystemSlotTypes.Person.value`
     samples: List[str] = OmitNone() # TODO: check
     multipleValues: LanguageModelIntentSlotMultipleValues = OmitNone()
 
-@dataclass
+@fast_dict
+@dataclass(**DATACLASS_SLOTS)
 class LanguageModelIntent:
     name: str
     slots: List[LanguageModelIntentSlot] = field(default_factory=list)
     samples: List[str] = field(default_factory=list)
 
-@dataclass
+@fast_dict
+@dataclass(**DATACLASS_SLOTS)
 class LanguageModelTypeValueName:
     value: str
     synonyms: List[str] = OmitNone()
 
-@dataclass
+@fast_dict
+@dataclass(**DATACLASS_SLOTS)
 class LanguageModelTypeValue:
     id: str
     name: LanguageModelTypeValueName
 
-@dataclass
+@fast_dict
+@dataclass(**DATACLASS_SLOTS)
 class LanguageModelType:
     name: str
     values: List[LanguageModelTypeValue]
@@ -51,15 +56,18 @@ class FallbackIntentSensitivity(Enum):
     MEDIUM = "MEDIUM"
     HIGH = "HIGH"
 
-@dataclass
+@fast_dict
+@dataclass(**DATACLASS_SLOTS)
 class LanguageModelConfigurationFallbackSensitivity:
     level: FallbackIntentSensitivity = FallbackIntentSensitivity.LOW
 
-@dataclass
+@fast_dict
+@dataclass(**DATACLASS_SLOTS)
 class LanguageModelConfiguration:
     fallbackIntentSensitivity: LanguageModelConfigurationFallbackSensitivity = OmitNone()
 
-@dataclass
+@fast_dict
+@dataclass(**DATACLASS_SLOTS)
 class LanguageModel:
     invocationName: str
     intents: List[LanguageModelIntent]
@@ -70,7 +78,8 @@ class LanguageModel:
 # Dialog
 #
 
-@dataclass
+@fast_dict
+@dataclass(**DATACLASS_SLOTS)
 class Dialog:
     pass
 
@@ -78,7 +87,8 @@ class Dialog:
 # Prompts
 #
 
-@dataclass
+@fast_dict
+@dataclass(**DATACLASS_SLOTS)
 class Prompt:
     pass
 
@@ -86,13 +96,15 @@ class Prompt:
 # Root
 #
 
-@dataclass
+@fast_dict
+@dataclass(**DATACLASS_SLOTS)
 class InteractionModel:
     languageModel: LanguageModel
     dialog: Dialog = OmitNone()
     prompts: List[Prompt] = OmitNone()
 
-@dataclass
+@fast_dict
+@dataclass(**DATACLASS_SLOTS)
 class Agent:
     interactionModel: InteractionModel
     # TODO: complete
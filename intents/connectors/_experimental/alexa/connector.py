@@ -19,7 +19,7 @@ import shutil
 import logging
 
 from intents import Agent, Intent
-from intents.helpers.data_classes import to_dict
+from intents.helpers.data_classes import to_dict, dataclass_json_default
 from intents.connectors.interface import Connector, ServiceEntityMappings, FulfillmentRequest
 from intents.connectors._experimental.alexa import names, export, language, fulfillment, fulfillment_schemas
 from intents.connectors._experimental.alexa.slot_types import ENTITY_MAPPINGS
@@ -74,7 +74,7 @@ class AlexaConnector(Connector):
             invocation_name
         )
     
-    def export(self, destination: str):
+    def export(self, destination: str, indent: int=None):
         """
         Export Agent in the given folder:
 
@@ -88,8 +88,15 @@ class AlexaConnector(Connector):
 
         The export will generate one JSON file per language, they can be imported
         from the Alexa console. Destination will be overwritten if already existing.
+
+        Files are UTF-8 encoded, and written in compact form by default. Set
+        `indent` to get human-readable files, e.g. for debugging.
+
+        Args:
+            destination: The export folder
+            indent: Indentation level of the exported JSON files
         """
-        rendered = self.export_component.render()
+        rendered = self.export_component.render_agents()
 
         if os.path.isdir(destination):
             logger.warning("Removing existing export folder: %s", destination)
@@ -97,8 +104,8 @@ class AlexaConnector(Connector):
         os.makedirs(destination)
 
         for lang, data in rendered.items():
-            with open(os.path.join(destination, f"agent.{lang.value}.json"), "w") as f:
-                json.dump(data, f, indent=4)
+            with open(os.path.join(destination, f"agent.{lang.value}.json"), "w", encoding="utf-8") as f:
+                f.write(json.dumps(data, indent=indent, ensure_ascii=False, default=dataclass_json_default))
 
     def upload(self):
         """
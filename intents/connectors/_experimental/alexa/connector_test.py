@@ -7,3 +7,11 @@ def test_export_example_agent_no_exceptions():
     alexa = AlexaConnector(ExampleAgent, "any invocation")
     with tempfile.TemporaryDirectory() as temp_dir:
         alexa.export(temp_dir)
+
+def test_render_default_intents_not_shared():
+    rendered = AlexaConnector(ExampleAgent, "any invocation").export_component.render()
+    for agent in rendered.values():
+        agent["interactionModel"]["languageModel"]["intents"][-1]["samples"].append("leaked")
+    rendered = AlexaConnector(ExampleAgent, "any invocation").export_component.render()
+    for agent in rendered.values():
+        assert agent["interactionModel"]["languageModel"]["intents"][-1]["samples"] == []
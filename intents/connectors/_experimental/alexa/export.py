@@ -14,19 +14,29 @@ Note that there are some relevant TODOs in this module (e.g. intent names may be
 ambiguous, punctuation is stripped from utterances, and so on..)
 """
 import re
+import string
 import logging
-from typing import List, Dict, Type
-from dataclasses import asdict
+from functools import partial, lru_cache
+from itertools import repeat
+from typing import Any, Callable, List, Dict, Type
 
 from intents import Intent, Agent, EntityMixin
+from intents.helpers.misc import LazyNames
 from intents.language import intent_language, intent_language_data, agent_supported_languages, LanguageCode
 from intents.connectors._experimental.alexa import agent_schemas as ask_schema
 from intents.connectors._experimental.alexa import names, language
 
-from intents.helpers.data_classes import custom_asdict_factory
-
 logger = logging.getLogger(__name__)
 
+# TODO: refine, especially for List parameters. Also, "{", "}" and "_" are only
+# allowed in slot references
+RE_UTTERANCE_INVALID_CHARS = re.compile(r"[^a-zA-Z0-9 \-\{\}\_\.\']+")
+_UTTERANCE_VALID_CHARS = frozenset(string.ascii_letters + string.digits + " -{}_.'")
+# Same as RE_UTTERANCE_INVALID_CHARS, for ASCII strings
+_ASCII_UTTERANCE_DELETE_TABLE = str.maketrans("", "", "".join(
+    c for c in map(chr, range(128)) if c not in _UTTERANCE_VALID_CHARS
+))
+
 # TODO: model in framework
 DEFAULT_INTENTS = [
     ask_schema.LanguageModelIntent(
@@ -57,6 +67,9 @@ class AlexaExportComponent:
     language_component: language.AlexaLanguageComponent
     invocation_name: str
 
+    _intent_language_data: Dict[LanguageCode, Dict[Type[Intent], intent_language.IntentLanguageData]]
+    _entity_service_names: LazyNames
+
     def __init__(self,
         agent_cls: Type[Agent],
         names_component: names.AlexaNamesComponent,
@@ -67,46 +80,88 @@ class AlexaExportComponent:
         self.names_component = names_component
         self.language_component = language_component
         self.invocation_name = invocation_name
+        self._intent_language_data = {}
+        # Slot type names don't depend on language: they are computed once, and
+        # reused for all the intents and languages in the export
+        self._entity_service_names = LazyNames(names_component.entity_service_name)
+
+    def render_agents(self) -> Dict[LanguageCode, ask_schema.Agent]:
+        """
+        Same as :meth:`render`, but return schema objects instead of dicts.
+        These can be serialized straight to JSON, without building dicts first:
+
+        .. code-block:: python
+
+            json.dumps(rendered_agent, default=dataclass_json_default)
+        """
+        return self._render_languages(self._render_agent_with_defaults)
 
     def render(self) -> Dict[LanguageCode, dict]:
+        return self._render_languages(self._render_agent_dict)
+
+    def _render_languages(self, render_language: Callable[[LanguageCode], Any]) -> Dict[LanguageCode, Any]:
+        """
+        Call `render_language` on every Agent language.
+        """
         languages: List[LanguageCode] = agent_supported_languages(self.agent_cls)
-        result = {}
-        for lang in languages:
-            rendered = self.render_agent(lang)
-            rendered.interactionModel.languageModel.intents.extend(DEFAULT_INTENTS)
-            result[lang] = asdict(rendered, dict_factory=custom_asdict_factory())
-        return result
+        return {lang: render_language(lang) for lang in languages}
 
-    def render_agent(self, lang: LanguageCode) -> ask_schema.Agent:
-        return ask_schema.Agent(
-            interactionModel=self.render_interaction_model(lang)
-        )
+    def _render_agent_with_defaults(self, lang: LanguageCode) -> ask_schema.Agent:
+        rendered = self.render_agent(lang)
+        rendered.interactionModel.languageModel.intents.extend(DEFAULT_INTENTS)
+        return rendered
 
-    def render_interaction_model(self, lang: LanguageCode) -> ask_schema.InteractionModel:
-        return ask_schema.InteractionModel(
-            languageModel=self.render_language_model(lang)
-        )
+    def _render_agent_dict(self, lang: LanguageCode) -> dict:
+        rendered = self.render_agent(lang)._to_dict()
+        rendered["interactionModel"]["languageModel"]["intents"].extend(i._to_dict() for i in DEFAULT_INTENTS)
+        return rendered
 
-    def render_language_model(self, lang: LanguageCode) -> ask_schema.LanguageModel:
-        intents = [self.render_intent(i, lang) for i in self.agent_cls.intents]
+    def render_agent(self, lang: LanguageCode) -> ask_schema.Agent:
+        language_data = self.intent_language_data(lang)
+        intents = map(self.render_intent, language_data.keys(), repeat(lang), language_data.values())
         intents = [i for i in intents if i]
-        return ask_schema.LanguageModel(
-            invocationName=self.invocation_name,
-            intents=intents,
-            types=[self.render_slot_type(e, lang) for e in self.agent_cls._entities_by_name.values()]
-            # TODO: complete
+        render_slot_type = partial(self.render_slot_type, lang=lang)
+        return ask_schema.Agent(
+            interactionModel=ask_schema.InteractionModel(
+                languageModel=ask_schema.LanguageModel(
+                    invocationName=self.invocation_name,
+                    intents=intents,
+                    types=list(map(render_slot_type, self.agent_cls._entities_by_name.values()))
+                    # TODO: complete
+                )
+            )
         )
 
     #
     # Intent
     #
 
-    def render_intent(self, intent_cls: Type[Intent], lang: LanguageCode) -> ask_schema.LanguageModelIntent:
+    def intent_language_data(self, lang: LanguageCode) -> Dict[Type[Intent], intent_language.IntentLanguageData]:
+        """
+        Language data of all the Agent intents in the given language. This is
+        loaded from resources in a single pass the first time it is requested,
+        and then reused by subsequent renders.
+        """
+        result = self._intent_language_data.get(lang)
+        if result is None:
+            result = {
+                intent_cls: intent_language_data(self.agent_cls, intent_cls, lang)[lang]
+                for intent_cls in self.agent_cls.intents
+            }
+            self._intent_language_data[lang] = result
+        return result
+
+    def render_intent(
+        self,
+        intent_cls: Type[Intent],
+        lang: LanguageCode,
+        language_data: intent_language.IntentLanguageData=None
+    ) -> ask_schema.LanguageModelIntent:
         """
         Return None if intent has no example utterances
         """
         slots = self.render_intent_slots(intent_cls)
-        samples = self.render_intent_samples(intent_cls, lang)
+        samples = self.render_intent_samples(intent_cls, lang, language_data)
         if not samples:
             return None
         return ask_schema.LanguageModelIntent(
@@ -117,48 +172,36 @@ class AlexaExportComponent:
         )
 
     def render_intent_slots(self, intent_cls: Type[Intent]) -> List[ask_schema.LanguageModelIntentSlot]:
-        result = []
-        for param_name, param_metadata in intent_cls.parameter_schema.items():
-            entity_cls = param_metadata.entity_cls
-            slot_type = self.names_component.entity_service_name(entity_cls)
-
-            result.append(ask_schema.LanguageModelIntentSlot(
+        entity_service_names = self._entity_service_names
+        return [
+            ask_schema.LanguageModelIntentSlot(
                 name=param_name,
-                type=slot_type,
+                type=entity_service_names[param_metadata.entity_cls],
                 multipleValues=ask_schema.LanguageModelIntentSlotMultipleValues(
                     enabled=param_metadata.is_list
                 )
-            ))
-        return result
+            ) for param_name, param_metadata in intent_cls.parameter_schema.items()
+        ]
 
-
-    def render_intent_samples(self, intent_cls: Type[Intent], lang: LanguageCode) -> List[str]:
-        language_data = intent_language_data(self.agent_cls, intent_cls, lang)
-        language_data = language_data[lang]
-        result = []
-        for utterance in language_data.example_utterances:
-            rendered_chunks = []
-            for chunk in utterance.chunks():
-                if isinstance(chunk, intent_language.TextUtteranceChunk):
-                    rendered_chunks.append(chunk.text)
-                elif isinstance(chunk, intent_language.EntityUtteranceChunk):
-                    rendered_chunks.append("{" + chunk.parameter_name + "}")
-                else:
-                    raise ValueError(f"Unsupported utterance chunk type {type(chunk)}. This looks like a bug, please file an issue at https://github.com/dariowho/intents")
-            utterance = "".join(rendered_chunks)
-            # TODO: refine, especially for List parameters. Also, "{", "}" and
-            # "_" are only allowed in slot references
-            utterance = re.sub(r"[^a-zA-Z0-9 \-\{\}\_\.\']+", '', utterance)
-            result.append(utterance)
-        return result
+    def render_intent_samples(
+        self,
+        intent_cls: Type[Intent],
+        lang: LanguageCode,
+        language_data: intent_language.IntentLanguageData=None
+    ) -> List[str]:
+        if language_data is None:
+            language_data = self.intent_language_data(lang)[intent_cls]
+        return [
+            "".join([_render_sample_chunk(chunk) for chunk in utterance.chunks()])
+            for utterance in language_data.example_utterances
+        ]
 
     #
     # Slot Type
     #
 
     def render_slot_type(self, entity_cls: Type[EntityMixin], lang: LanguageCode) -> ask_schema.LanguageModelType:
-        language_data = self.language_component.entity_language_data(entity_cls, lang)
-        language_data = language_data[lang]
+        language_data = self.language_component.entity_entries(entity_cls, lang)
         slot_values = [self.render_slot_value(entity_cls, entry) for entry in language_data]
         slot_values = [v for v in slot_values if v]
         return ask_schema.LanguageModelType(
@@ -175,6 +218,42 @@ class AlexaExportComponent:
             )
         )
 
+def _render_sample_chunk(chunk: intent_language.UtteranceChunk) -> str:
+    render_chunk = _CHUNK_RENDERERS.get(type(chunk))
+    if render_chunk is None:
+        raise ValueError(f"Unsupported utterance chunk type {type(chunk)}. This looks like a bug, please file an issue at https://github.com/dariowho/intents")
+    return render_chunk(chunk)
+
+def _render_text_chunk(chunk: intent_language.TextUtteranceChunk) -> str:
+    # Sanitization only deletes characters: text chunks can be sanitized one
+    # by one, rather than the whole utterance once it's joined
+    return _sanitize_utterance(chunk.text)
+
+def _render_entity_chunk(chunk: intent_language.EntityUtteranceChunk) -> str:
+    # Parameter names are identifiers, and need no sanitization
+    return _slot_reference(chunk.parameter_name)
+
+@lru_cache(maxsize=1024)
+def _slot_reference(parameter_name: str) -> str:
+    # The same few parameters are referenced by many utterances: build their
+    # references once
+    return "{" + parameter_name + "}"
+
+_CHUNK_RENDERERS = {
+    intent_language.TextUtteranceChunk: _render_text_chunk,
+    intent_language.EntityUtteranceChunk: _render_entity_chunk
+}
+
+def _sanitize_utterance(utterance: str) -> str:
+    """
+    Strip characters that are not accepted by Alexa from the given utterance.
+    Most utterances are plain ASCII: these are filtered with a translation
+    table, rather than with the regex engine.
+    """
+    if utterance.isascii():
+        return utterance.translate(_ASCII_UTTERANCE_DELETE_TABLE)
+    return RE_UTTERANCE_INVALID_CHARS.sub('', utterance)
+
 # from example_agent.agent import ExampleAgent
 # from intents.connectors._experimental.alexa import AlexaConnector
 
@@ -44,10 +44,12 @@ class AlexaLanguageComponent:
     agent_cls: Type[Agent]
 
     _entry_id_to_value: Dict[LanguageCode, Dict[str, str]]
+    _entity_language_cache: Dict[Type[EntityMixin], Dict[LanguageCode, List["AlexaEntityEntry"]]]
 
     def __init__(self, agent_cls: Type[Agent]):
         self.agent_cls = agent_cls
         self._entry_id_to_value = {}
+        self._entity_language_cache = {}
 
         self._build_indices(agent_cls)
 
@@ -56,6 +58,7 @@ class AlexaLanguageComponent:
         self._entry_id_to_value = defaultdict(dict)
         for entity_cls in agent_cls._entities_by_name.values():
             language_data = self._entity_language_data(agent_cls, entity_cls)
+            self._entity_language_cache[entity_cls] = language_data
             for language, entries in language_data.items():
                 entries_to_value = {}
                 for entry in entries:
@@ -120,8 +123,33 @@ class AlexaLanguageComponent:
         """
         return self._entry_id_to_value[lang][alexa_entry_id]
 
-    def entity_language_data(self, entity_cls: Type[EntityMixin], lang: LanguageCode=None):
-        return self._entity_language_data(self.agent_cls, entity_cls, lang)
+    def entity_language_data(
+        self,
+        entity_cls: Type[EntityMixin],
+        lang: LanguageCode=None
+    ) -> Dict[LanguageCode, List[AlexaEntityEntry]]:
+        """
+        Entity language data, as returned by :meth:`_entity_language_data`.
+        Data of the Agent entities is loaded once, when indices are built, and
+        then served from memory.
+        """
+        language_data = self._entity_language_cache.get(entity_cls)
+        if language_data is None:
+            language_data = self._entity_language_data(self.agent_cls, entity_cls)
+            self._entity_language_cache[entity_cls] = language_data
+        if lang:
+            return {lang: language_data[lang]}
+        return language_data
+
+    def entity_entries(self, entity_cls: Type[EntityMixin], lang: LanguageCode) -> List[AlexaEntityEntry]:
+        """
+        Same as :meth:`entity_language_data`, but return the list of entries
+        for `lang` directly, rather than wrapping it in a language dict.
+        """
+        language_data = self._entity_language_cache.get(entity_cls)
+        if language_data is None:
+            language_data = self.entity_language_data(entity_cls)
+        return language_data[lang]
 
     @staticmethod
     def _entity_language_data(
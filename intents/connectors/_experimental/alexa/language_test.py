@@ -115,3 +115,13 @@ def invalid_entities_raise_error(*args):
 
     with pytest.raises(ValueError):
         language.AlexaLanguageComponent(ToyAgent)
+
+@patch('intents.language.intent_language_data')
+def test_language_data_is_cached(*args):
+    ToyAgent = _get_toy_agent()
+    ToyAgent.register(ToyIntent)
+    lc = language.AlexaLanguageComponent(ToyAgent)
+    with patch.object(language.entity_language, "entity_language_data") as mock_language_data:
+        language_data = lc.entity_language_data(ToyEntity, LanguageCode.ENGLISH)
+        mock_language_data.assert_not_called()
+    assert language_data[LanguageCode.ENGLISH][1].alexa_value == "plus"
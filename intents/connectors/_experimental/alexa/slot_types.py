@@ -7,14 +7,22 @@ from intents.connectors._experimental.alexa.dates import parse_alexa_date
 
 logger = logging.getLogger(__name__)
 
+_AMAZON_COLOR = "AMAZON.Color"
+_AMAZON_GENRE = "AMAZON.Genre"
+_AMAZON_MUSICIAN = "AMAZON.Musician"
+_AMAZON_NUMBER = "AMAZON.NUMBER"
+_AMAZON_LANGUAGE = "AMAZON.Language"
+_AMAZON_PERSON = "AMAZON.Person"
+_AMAZON_PHONE_NUMBER = "AMAZON.PhoneNumber"
+
 class SystemSlotTypes(Enum):
-    Color = "AMAZON.Color"
-    Genre = "AMAZON.Genre"
-    Musician = "AMAZON.Musician"
-    Number = "AMAZON.NUMBER"
-    Language = "AMAZON.Language"
-    Person = "AMAZON.Person"
-    PhoneNumber = "AMAZON.PhoneNumber"
+    Color = _AMAZON_COLOR
+    Genre = _AMAZON_GENRE
+    Musician = _AMAZON_MUSICIAN
+    Number = _AMAZON_NUMBER
+    Language = _AMAZON_LANGUAGE
+    Person = _AMAZON_PERSON
+    PhoneNumber = _AMAZON_PHONE_NUMBER
 
 class DummyMapping(EntityMapping):
     service_name = None
@@ -47,14 +55,14 @@ class DateMapping(EntityMapping):
         return str(entity)
 
 ENTITY_MAPPINGS = ServiceEntityMappings.from_list([
-    StringEntityMapping(Sys.Person, SystemSlotTypes.Person.value),
-    StringEntityMapping(Sys.Color, SystemSlotTypes.Color.value),
+    StringEntityMapping(Sys.Person, _AMAZON_PERSON),
+    StringEntityMapping(Sys.Color, _AMAZON_COLOR),
     DateMapping(),
     DummyMapping(Sys.Email), # TODO: implement
-    StringEntityMapping(Sys.Integer, SystemSlotTypes.Number.value),
-    StringEntityMapping(Sys.PhoneNumber, SystemSlotTypes.PhoneNumber.value),
-    StringEntityMapping(Sys.Language, SystemSlotTypes.Language.value),
+    StringEntityMapping(Sys.Integer, _AMAZON_NUMBER),
+    StringEntityMapping(Sys.PhoneNumber, _AMAZON_PHONE_NUMBER),
+    StringEntityMapping(Sys.Language, _AMAZON_LANGUAGE),
     DummyMapping(Sys.Url), # TODO: implement
-    StringEntityMapping(Sys.MusicArtist, SystemSlotTypes.Musician.value),
-    StringEntityMapping(Sys.MusicGenre, SystemSlotTypes.Genre.value)
+    StringEntityMapping(Sys.MusicArtist, _AMAZON_MUSICIAN),
+    StringEntityMapping(Sys.MusicGenre, _AMAZON_GENRE)
 ])
\ No newline at end of file
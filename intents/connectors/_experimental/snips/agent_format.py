@@ -11,27 +11,31 @@ from typing import List, Dict, Union
 from dataclasses import dataclass, field
 
 import dacite
-from intents.helpers.data_classes import OmitNone
+from intents.helpers.data_classes import OmitNone, fast_dict, DATACLASS_SLOTS
 
 #
 # Intent
 #
 
-@dataclass
+@fast_dict
+@dataclass(**DATACLASS_SLOTS)
 class DatasetIntentUtteranceTextSegment:
     text: str
 
-@dataclass
+@fast_dict
+@dataclass(**DATACLASS_SLOTS)
 class DatasetIntentUtteranceEntitySegment:
     text: str
     entity: str
     slot_name: str
 
-@dataclass
+@fast_dict
+@dataclass(**DATACLASS_SLOTS)
 class DatasetIntentUtterance:
     data: List[Union[DatasetIntentUtteranceEntitySegment, DatasetIntentUtteranceTextSegment]]
 
-@dataclass
+@fast_dict
+@dataclass(**DATACLASS_SLOTS)
 class DatasetIntent:
     utterances: List[DatasetIntentUtterance]
 
@@ -39,12 +43,14 @@ class DatasetIntent:
 # Entity
 #
 
-@dataclass
+@fast_dict
+@dataclass(**DATACLASS_SLOTS)
 class DatasetEntityEntry:
     value: str
     synonyms: List[str] = field(default_factory=list)
 
-@dataclass
+@fast_dict
+@dataclass(**DATACLASS_SLOTS)
 class DatasetEntity:
     use_synonyms: bool
     automatically_extensible: bool
@@ -55,7 +61,8 @@ class DatasetEntity:
 # Dataset
 #
 
-@dataclass
+@fast_dict
+@dataclass(**DATACLASS_SLOTS)
 class Dataset:
     intents: Dict[str, DatasetIntent]
     entities: Dict[str, Union[DatasetEntity, dict]]
@@ -21,11 +21,13 @@ More details about Snips can be found at
 """
 import os
 import json
-import shutil
+import fnmatch
+import hashlib
 import logging
-from typing import Union, Type
-
-import snips_nlu
+import tempfile
+import weakref
+import functools
+from typing import List, Union, Type, Tuple, TYPE_CHECKING
 
 from intents import Intent, Agent, LanguageCode
 from intents.language import agent_supported_languages, ensure_language_code
@@ -33,8 +35,47 @@ from intents.connectors.interface import Connector, ServiceEntityMappings, Fulfi
 from intents.connectors._experimental.snips.prediction import SnipsPrediction, SnipsPredictionComponent
 from intents.connectors._experimental.snips import entities, prediction_format
 
+if TYPE_CHECKING:
+    # `snips_nlu` is slow to import: it is only loaded when a connector is built
+    import snips_nlu
+
 logger = logging.getLogger(__name__)
 
+# Prediction components only depend on Agent and entity mappings: connectors
+# for the same Agent share one, as long as any of them is alive
+_COMPONENT_CACHE: "weakref.WeakValueDictionary[tuple, SnipsPredictionComponent]" = weakref.WeakValueDictionary()
+
+def _model_cache_name(lang: LanguageCode, dataset_dict: dict) -> str:
+    import snips_nlu
+
+    # Models trained by a different version of snips-nlu may not load
+    key = snips_nlu.__version__ + "\n" + json.dumps(dataset_dict, sort_keys=True)
+    dataset_hash = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+    return f"{lang.value}-{dataset_hash}"
+
+def _persist_engine(engine: "snips_nlu.SnipsNLUEngine", model_path: str):
+    """
+    Persist a trained engine in `model_path`. The model is written to a
+    temporary folder next to it, and then moved in place: a partially written
+    model is never found at `model_path`.
+    """
+    cache_dir = os.path.dirname(model_path)
+    os.makedirs(cache_dir, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=cache_dir) as tmp_dir:
+        tmp_model_path = os.path.join(tmp_dir, "model")
+        engine.persist(tmp_model_path)
+        try:
+            os.replace(tmp_model_path, model_path)
+        except OSError:
+            # Another process persisted the same model in the meantime
+            if not os.path.isdir(model_path):
+                raise
+            logger.info("Snips model was already persisted: %s", model_path)
+
+@functools.lru_cache(maxsize=None)
+def _supported_languages(agent_cls: Type[Agent]) -> Tuple[LanguageCode, ...]:
+    return tuple(agent_supported_languages(agent_cls))
+
 class SnipsConnector(Connector):
     """
     This is a :class:`~intents.connectors.interface.Connector` that runs entirely locally, without needing any resident
@@ -57,23 +98,35 @@ class SnipsConnector(Connector):
             randomly if None
         default_language: Default language for predictions. English will be used
             if None.
+        cache_dir: A folder where trained models are persisted, so that
+            :meth:`upload` can skip training when the Agent didn't change. If
+            None, models are not persisted
     """
 
     entity_mappings: ServiceEntityMappings = entities.ENTITY_MAPPINGS
 
-    nlu_engine: snips_nlu.SnipsNLUEngine = None
+    nlu_engine: "snips_nlu.SnipsNLUEngine" = None
     prediction_component: SnipsPredictionComponent
 
     def __init__(self,
         agent_cls: Type[Agent],
         default_session: str=None,
-        default_language: Union[LanguageCode, str]=None
+        default_language: Union[LanguageCode, str]=None,
+        cache_dir: str=None
     ):
+        import snips_nlu
+
         super().__init__(agent_cls, default_session, default_language)
+        self.cache_dir = cache_dir
         self.nlu_engines = {
-            lang: snips_nlu.SnipsNLUEngine() for lang in agent_supported_languages(agent_cls)
+            lang: snips_nlu.SnipsNLUEngine() for lang in _supported_languages(agent_cls)
         }
-        self.prediction_component = SnipsPredictionComponent(agent_cls, self.entity_mappings)
+        component_key = (agent_cls, id(self.entity_mappings))
+        component = _COMPONENT_CACHE.get(component_key)
+        if component is None:
+            component = SnipsPredictionComponent(agent_cls, self.entity_mappings)
+            _COMPONENT_CACHE[component_key] = component
+        self.prediction_component = component
 
     def export(self, destination: str):
         """
@@ -88,35 +141,55 @@ class SnipsConnector(Connector):
             snips.export("./TMP_SNIPS")
 
         The export will generate one JSON file per language, they can be loaded
-        into Snips as a JSON Dataset.
+        into Snips as a JSON Dataset. Existing `agent.*.json` files in the
+        destination folder are replaced; other files are left untouched.
 
         Args:
             destination: A folder that will contain exported JSON files
         """
         from intents.connectors._experimental.snips import export
 
-        rendered = export.render(self)
-
-        if os.path.isdir(destination):
-            logger.warning("Removing existing export folder: %s", destination)
-            shutil.rmtree(destination)
-        os.makedirs(destination)
+        os.makedirs(destination, exist_ok=True)
+        with os.scandir(destination) as entries:
+            stale_paths = [e.path for e in entries if fnmatch.fnmatchcase(e.name, "agent.*.json") and e.is_file()]
+        for stale_path in stale_paths:
+            logger.warning("Removing existing export file: %s", stale_path)
+            os.remove(stale_path)
 
-        for lang, data in rendered.items():
-            with open(os.path.join(destination, f"agent.{lang.value}.json"), "w") as f:
-                json.dump(data, f, indent=4)
+        export.export_to_file(self, destination)
 
     def upload(self):
         """
         As Snips runs locally as a Python library, there is no external service
         to upload the model to. Instead, `upload` will train Snips local models.
 
-        Currently there is no persistence for trained models. This means that
-        `upload` should be called every time :class:`SnipsConnector` is instantiated.
+        If :attr:`cache_dir` is set, trained models are persisted there, indexed
+        by a hash of the training dataset and of the `snips-nlu` version. When
+        `upload` is called on an Agent that didn't change since the last
+        training, models are loaded from there instead of being trained again.
+
+        The Agent is rendered again from its language files, and language data
+        that was cached by previous predictions is discarded, so that responses
+        are up to date as well.
         """
+        import snips_nlu
         from intents.connectors._experimental.snips import export
-        for lang, rendered in export.render(self).items():
-            self.nlu_engines[lang].fit(rendered)
+
+        self.prediction_component.cache_clear()
+        for lang, dataset in export.render_datasets(self).items():
+            dataset_dict = dataset._to_dict()
+            if not self.cache_dir:
+                self.nlu_engines[lang].fit(dataset_dict)
+                continue
+
+            model_path = os.path.join(self.cache_dir, _model_cache_name(lang, dataset_dict))
+            if os.path.isdir(model_path):
+                logger.info("Loading trained Snips model from cache: %s", model_path)
+                self.nlu_engines[lang] = snips_nlu.SnipsNLUEngine.from_path(model_path)
+                continue
+
+            self.nlu_engines[lang].fit(dataset_dict)
+            _persist_engine(self.nlu_engines[lang], model_path)
 
     def predict(self, message: str, session: str=None, language: Union[LanguageCode, str]=None) -> SnipsPrediction:
         """
@@ -150,13 +223,37 @@ class SnipsConnector(Connector):
             session: Any string identifying a conversation
             language: A LanguageCode object, or a ISO 639-1 string (e.g. "en")
         """
-        if not language:
-            language = self.default_language
-        language = ensure_language_code(language)
+        language = self._language_code(language)
         parse_result_dict = self.nlu_engines[language].parse(message)
         parse_result = prediction_format.from_dict(parse_result_dict)
-        prediction = self.prediction_component.prediction_from_parse_result(parse_result, language)
-        return self.prediction_component.fulfill_local(prediction, language)
+        return self.prediction_component.predict_and_fulfill(parse_result, language)
+
+    def predict_batch(
+        self,
+        messages: List[str],
+        session: str=None,
+        language: Union[LanguageCode, str]=None
+    ) -> List[SnipsPrediction]:
+        """
+        Predict a list of User messages in the same session and language. This
+        is equivalent to calling :meth:`predict` on each message, but parsing
+        runs in a tight loop. Useful for evaluating a trained model on a test
+        set:
+
+        >>> predictions = snips.predict_batch(["Hi, my name is Guido", "What's your name?"])
+        >>> [p.intent.name for p in predictions]
+        ['smalltalk.UserNameGive', 'smalltalk.AgentNameAsk']
+
+        Args:
+            messages: The User messages to predict
+            session: Any string identifying a conversation
+            language: A LanguageCode object, or a ISO 639-1 string (e.g. "en")
+        """
+        language = self._language_code(language)
+        parse = self.nlu_engines[language].parse
+        from_dict = prediction_format.from_dict
+        parse_results = [from_dict(parse(message)) for message in messages]
+        return self.prediction_component.predict_batch(parse_results, language)
 
     def trigger(self, intent: Intent, session: str=None, language: Union[LanguageCode, str]=None) -> SnipsPrediction:
         """
@@ -181,12 +278,15 @@ class SnipsConnector(Connector):
             session: Any string identifying a conversation
             language: A LanguageCode object, or a ISO 639-1 string (e.g. "en")
         """
-        if not language:
-            language = self.default_language
-        language = ensure_language_code(language)
+        language = self._language_code(language)
         prediction = self.prediction_component.prediction_from_intent(intent, language)
         return self.prediction_component.fulfill_local(prediction, language)
 
+    def _language_code(self, language: Union[LanguageCode, str, None]) -> LanguageCode:
+        if not language:
+            language = self.default_language
+        return ensure_language_code(language)
+
     def fulfill(self, fulfillment_request: FulfillmentRequest) -> dict:
         """
         *Not implemented*
@@ -1,6 +1,7 @@
 import os
 import tempfile
-from unittest.mock import MagicMock
+from types import MappingProxyType
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -9,6 +10,8 @@ from intents.language import LanguageCode, IntentResponseGroup, TextIntentRespon
 from intents.helpers import coffee_agent as ca 
 from intents.connectors._experimental.snips.connector import SnipsConnector
 from intents.connectors._experimental.snips.prediction import SnipsPrediction
+from intents.connectors._experimental.snips import prediction_format
+from intents.connectors._experimental.snips import export as snips_export
 
 def test_export_no_errors():
     c = SnipsConnector(ExampleAgent)
@@ -16,14 +19,28 @@ def test_export_no_errors():
         c.export(d)
         assert os.path.isfile(os.path.join(d, "agent.en.json"))
 
+def test_export_replaces_stale_files_only():
+    c = SnipsConnector(ExampleAgent)
+    with tempfile.TemporaryDirectory() as d:
+        for name in ["agent.xx.json", "other.json"]:
+            with open(os.path.join(d, name), "w") as f:
+                f.write("{}")
+        os.mkdir(os.path.join(d, "agent.yy.json"))
+        c.export(d)
+        assert not os.path.exists(os.path.join(d, "agent.xx.json"))
+        assert os.path.isfile(os.path.join(d, "other.json"))
+        assert os.path.isdir(os.path.join(d, "agent.yy.json"))
+
+_FAKE_PARSE_RESULT = MappingProxyType({
+    'input': 'I want an espresso',
+    'intent': {'intentName': 'AskEspresso', 'probability': 0.677},
+    'slots': []
+})
+
 def test_predict_default_language():
     class MockSnipsEngine:
         def parse(self, message):
-            return {
-                'input': 'I want an espresso',
-                'intent': {'intentName': 'AskEspresso', 'probability': 0.677},
-                'slots': []
-            }
+            return _FAKE_PARSE_RESULT
     c = SnipsConnector(ca.CoffeeAgent)
     c.nlu_engines = {
         LanguageCode.ENGLISH: MockSnipsEngine(),
@@ -40,3 +57,57 @@ def test_predict_default_language():
     assert result.fulfillment_messages == expected_messages
     with pytest.warns(DeprecationWarning):
         assert result.fulfillment_message_dict == expected_messages
+
+def test_predict_batch():
+    class MockSnipsEngine:
+        def parse(self, message):
+            return _FAKE_PARSE_RESULT
+    c = SnipsConnector(ca.CoffeeAgent)
+    c.nlu_engines = {
+        LanguageCode.ENGLISH: MockSnipsEngine(),
+        LanguageCode.ITALIAN: MockSnipsEngine()
+    }
+    results = c.predict_batch(["Fake text", "More fake text"])
+    assert [r.intent for r in results] == [ca.AskEspresso(), ca.AskEspresso()]
+    assert results[0].fulfillment_messages == c.predict("Fake text").fulfillment_messages
+
+def test_upload_loads_trained_model_from_cache():
+    with tempfile.TemporaryDirectory() as d:
+        c = SnipsConnector(ca.CoffeeAgent, cache_dir=d)
+        c.upload()
+        cached_models = os.listdir(d)
+        assert len(cached_models) == len(c.nlu_engines)
+
+        c = SnipsConnector(ca.CoffeeAgent, cache_dir=d)
+        mock_engines = {lang: MagicMock() for lang in c.nlu_engines}
+        c.nlu_engines = dict(mock_engines)
+        c.upload()
+        for engine in mock_engines.values():
+            engine.fit.assert_not_called()
+        assert os.listdir(d) == cached_models
+
+def test_upload_without_cache_dir():
+    c = SnipsConnector(ca.CoffeeAgent)
+    mock_engines = {lang: MagicMock() for lang in c.nlu_engines}
+    c.nlu_engines = dict(mock_engines)
+    c.upload()
+    for engine in mock_engines.values():
+        engine.fit.assert_called_once()
+        engine.persist.assert_not_called()
+
+def test_export_renders_agent_again():
+    c = SnipsConnector(ca.CoffeeAgent)
+    with patch.object(snips_export, "render_dataset", wraps=snips_export.render_dataset) as mock_render:
+        with tempfile.TemporaryDirectory() as d:
+            c.export(d)
+            c.export(d)
+    assert mock_render.call_count == 2 * len(c.nlu_engines)
+
+def test_predict_parse_result():
+    class MockSnipsEngine:
+        def parse(self, message):
+            return _FAKE_PARSE_RESULT
+    c = SnipsConnector(ca.CoffeeAgent)
+    c.nlu_engines = {lang: MockSnipsEngine() for lang in c.nlu_engines}
+    result = c.predict("Fake text, response is mocked anyway...")
+    assert result.parse_result == prediction_format.from_dict(_FAKE_PARSE_RESULT)
@@ -10,10 +10,14 @@ from intents.connectors.interface import EntityMapping, StringEntityMapping, Pat
 
 logger = logging.getLogger(__name__)
 
+_SNIPS_MUSIC_ARTIST = "snips/musicArtist"
+_SNIPS_NUMBER = "snips/number"
+_SNIPS_DATE = "snips/date"
+
 class BuiltinEntityTypes(Enum):
-    MusicArtist = "snips/musicArtist"
-    Number = "snips/number"
-    Date = "snips/date"
+    MusicArtist = _SNIPS_MUSIC_ARTIST
+    Number = _SNIPS_NUMBER
+    Date = _SNIPS_DATE
 
 class SnipsStringEntityMapping(StringEntityMapping):
     """
@@ -78,7 +82,7 @@ class DateMapping(EntityMapping):
     The mapping will receive the content of `slots[0].value`
     """
     entity_cls = Sys.Date
-    service_name = BuiltinEntityTypes.Date.value
+    service_name = _SNIPS_DATE
     supported_languages = [LanguageCode.ENGLISH]
 
     def from_service(self, service_data: dict):
@@ -90,8 +94,9 @@ class DateMapping(EntityMapping):
             logger.warning("Expected returned date to be of 'Day' grain. Snips returned '%s' "
                            "instead. This may cause unpredictable behavior.", grain)
 
-        dt = datetime.fromisoformat(service_data["value"])
-        return Sys.Date.from_py_date(dt.date())
+        # Values look like "2021-08-21 00:00:00 +02:00": only the date is needed
+        year, month, day = service_data["value"][:10].split("-")
+        return Sys.Date(int(year), int(month), int(day))
 
     def to_service(self, entity: Union[date, datetime, str]):
                                       # ^ Sys.Date is subclass of date
@@ -112,14 +117,24 @@ ENTITY_MAPPINGS = SnipsEntityMappings.from_list([
     SnipsPatchedEntityMapping(Sys.Color, color.I_IntentsColor),
     DateMapping(),
     PlaceholderEntityMapping(Sys.Email, "I_PlaceholderEmail"),
-    SnipsStringEntityMapping(Sys.Integer, BuiltinEntityTypes.Number.value),
+    SnipsStringEntityMapping(Sys.Integer, _SNIPS_NUMBER),
     PlaceholderEntityMapping(Sys.PhoneNumber, "I_PlaceholderPhoneNumber"),
     PatchedEntityMapping(Sys.Language, language.I_IntentsLanguage),
     PlaceholderEntityMapping(Sys.Url, "I_PlaceholderUrl"),
-    SnipsStringEntityMapping(Sys.MusicArtist, BuiltinEntityTypes.MusicArtist.value),
+    SnipsStringEntityMapping(Sys.MusicArtist, _SNIPS_MUSIC_ARTIST),
     SnipsPatchedEntityMapping(Sys.MusicGenre, music_genre.I_IntentsMusicGenre),
 ])
 
-BUILTIN_ENTITIES = [m.entity_cls for m in ENTITY_MAPPINGS.values() if m.service_name in [x.value for x in BuiltinEntityTypes]]
-PATCHED_MAPPINGS = [m for m in ENTITY_MAPPINGS.values() if isinstance(m, PatchedEntityMapping)]
-PLACEHOLDER_ENTITIES = [m.entity_cls for m in ENTITY_MAPPINGS.values() if isinstance(m, PlaceholderEntityMapping)]
+BUILTIN_ENTITIES = []
+PATCHED_MAPPINGS = []
+PLACEHOLDER_ENTITIES = []
+
+_builtin_entity_types = frozenset((_SNIPS_MUSIC_ARTIST, _SNIPS_NUMBER, _SNIPS_DATE))
+for _mapping in ENTITY_MAPPINGS.values():
+    if _mapping.service_name in _builtin_entity_types:
+        BUILTIN_ENTITIES.append(_mapping.entity_cls)
+    if isinstance(_mapping, PatchedEntityMapping):
+        PATCHED_MAPPINGS.append(_mapping)
+    if isinstance(_mapping, PlaceholderEntityMapping):
+        PLACEHOLDER_ENTITIES.append(_mapping.entity_cls)
+del _mapping
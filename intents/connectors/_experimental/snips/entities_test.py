@@ -33,6 +33,18 @@ def test_date_mapping_from_service():
     entity = mapping.from_service(parse_result.slots[0].value)
     assert entity == Sys.Date(2021, 8, 24)
 
+def test_date_mapping_from_service_timezone():
+    mapping = entities.DateMapping()
+    value = {
+        'kind': 'InstantTime',
+        'value': '2021-08-24 00:00:00 -07:00',
+        'grain': 'Day',
+        'precision': 'Exact'
+    }
+    entity = mapping.from_service(value)
+    assert entity == Sys.Date(2021, 8, 24)
+    assert isinstance(entity, Sys.Date)
+
 def test_date_mapping_unexpected_grain():
     mapping = entities.DateMapping()
     value = {
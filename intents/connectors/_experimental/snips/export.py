@@ -1,11 +1,12 @@
+import os
+import json
 import logging
-from dataclasses import asdict
-from collections import ChainMap
-from typing import List, Dict, Type
+import operator
+from typing import Dict, Type, Iterator, Tuple
 
 from intents import Intent, EntityMixin
-from intents.helpers.data_classes import custom_asdict_factory
-from intents.language import intent_language, entity_language
+from intents.helpers.misc import LazyNames
+from intents.language import intent_language, entity_language, IntentLanguageData
 from intents.language import agent_supported_languages, LanguageCode
 from intents.connectors._experimental.snips import SnipsConnector
 from intents.connectors._experimental.snips import entities as snips_entities
@@ -14,42 +15,111 @@ from intents.connectors._experimental.snips import agent_format as af
 logger = logging.getLogger(__name__)
 
 def render(connector: SnipsConnector) -> Dict[LanguageCode, dict]:
-    languages: List[LanguageCode] = agent_supported_languages(connector.agent_cls)
-    result = {}
-    for lang in languages:
-        try:
-            rendered = render_dataset(connector, lang)
-            result[lang] = asdict(rendered, dict_factory=custom_asdict_factory())
-        except NotImplementedError as exc:
-            logger.error("Could not export Agent for language %s: %s", lang, exc)
-    return result
+    return {lang: dataset._to_dict() for lang, dataset in render_datasets(connector).items()}
+
+def _render_datasets_iter(connector: SnipsConnector) -> Iterator[Tuple[LanguageCode, af.Dataset]]:
+    for lang in agent_supported_languages(connector.agent_cls):
+        dataset = _render_dataset_or_none(connector, lang)
+        if dataset:
+            yield lang, dataset
+
+def render_datasets(connector: SnipsConnector) -> Dict[LanguageCode, af.Dataset]:
+    """
+    Render one dataset per Agent language.
+    """
+    return dict(_render_datasets_iter(connector))
+
+def _render_dataset_or_none(connector: SnipsConnector, lang: LanguageCode) -> af.Dataset:
+    try:
+        return render_dataset(connector, lang)
+    except NotImplementedError as exc:
+        logger.error("Could not export Agent for language %s: %s", lang, exc)
+        return None
+
+def to_json(dataset: af.Dataset, **kwargs) -> str:
+    """
+    Serialize a rendered dataset to a JSON string. Keyword arguments are passed
+    to :func:`json.dumps`.
+    """
+    return json.dumps(dataset._to_dict(), **kwargs)
+
+def _entity_service_names() -> LazyNames:
+    """
+    Entity classes to their Snips service name. Names are looked up in entity
+    mappings the first time they are requested, and reused for the rest of the
+    rendering.
+    """
+    return LazyNames(snips_entities.ENTITY_MAPPINGS.service_name)
+
+def export_to_file(
+    connector: SnipsConnector,
+    destination: str=".",
+    datasets: Dict[LanguageCode, af.Dataset]=None
+):
+    """
+    Write one JSON dataset file per Agent language, named `agent.<lang>.json`.
+
+    Exports are meant to be loaded by Snips, not read: without `indent`, `json`
+    can use its C encoder instead of the pure-Python one. Each file is encoded
+    in memory and written at once, rather than chunk by chunk.
+
+    Args:
+        connector: The Snips Connector to export
+        destination: An existing folder that will contain the output files
+        datasets: Datasets that were already rendered. If None, languages are
+            rendered one at a time, and written as soon as they are ready
+    """
+    if datasets is None:
+        datasets_iter = _render_datasets_iter(connector)
+    else:
+        datasets_iter = datasets.items()
+    for lang, dataset in datasets_iter:
+        data_bytes = to_json(dataset).encode("utf-8")
+        with open(os.path.join(destination, f"agent.{lang.value}.json"), "wb") as f:
+            f.write(data_bytes)
 
 def render_dataset(connector: SnipsConnector, lang: LanguageCode) -> af.Dataset:
+    service_names = _entity_service_names()
     return af.Dataset(
-        intents=render_all_intents(connector, lang),
-        entities=render_all_entities(connector, lang),
+        intents=render_all_intents(connector, lang, service_names),
+        entities=render_all_entities(connector, lang, service_names),
         language=lang.value
     )
 
-def render_all_intents(connector: SnipsConnector, lang: LanguageCode):
+def render_all_intents(
+    connector: SnipsConnector,
+    lang: LanguageCode,
+    service_names: LazyNames=None
+):
     """
     Intents without example utterances will break Snips training. Here we filter
     them out.
     """
+    if service_names is None:
+        service_names = _entity_service_names()
+    agent_cls = connector.agent_cls
     result = {}
-    for intent in connector.agent_cls.intents:
-        rendered = render_intent(connector, intent, lang)
-        if rendered:
-            result[intent.name] = rendered
+    for intent in agent_cls.intents:
+        language_data = intent_language.intent_language_data(agent_cls, intent, lang)[lang]
+        if language_data.example_utterances:
+            result[intent.name] = render_intent(connector, intent, lang, service_names, language_data)
     return result
 
 def render_intent(
     connector: SnipsConnector,
     intent_cls: Type[Intent],
-    lang: LanguageCode
+    lang: LanguageCode,
+    service_names: LazyNames=None,
+    language_data: IntentLanguageData=None
 ) -> af.DatasetIntent:
-    language_data = intent_language.intent_language_data(connector.agent_cls, intent_cls, lang)
-    language_data = language_data[lang]
+    """
+    Render an Intent in the given language. `language_data` can be passed by
+    callers that already loaded it, otherwise it is loaded from resources.
+    """
+    if service_names is None:
+        service_names = _entity_service_names()
+    if language_data is None:
+        language_data = intent_language.intent_language_data(connector.agent_cls, intent_cls, lang)[lang]
 
     if not language_data.example_utterances:
         return None
@@ -60,18 +130,10 @@ def render_intent(
     for utterance in language_data.example_utterances:
         utterance_data = []
         for chunk in utterance.chunks():
-            if isinstance(chunk, intent_language.TextUtteranceChunk):
-                utterance_data.append(af.DatasetIntentUtteranceTextSegment(chunk.text))
-            elif isinstance(chunk, intent_language.EntityUtteranceChunk):
-                chunk: intent_language.EntityUtteranceChunk
-                entity_name = snips_entities.ENTITY_MAPPINGS.service_name(chunk.entity_cls)
-                utterance_data.append(af.DatasetIntentUtteranceEntitySegment(
-                    text=chunk.parameter_value,
-                    entity=entity_name,
-                    slot_name=chunk.parameter_name
-                ))
-            else:
+            render_chunk = _CHUNK_RENDERERS.get(type(chunk))
+            if render_chunk is None:
                 raise ValueError(f"Unsupported utterance chunk type {type(chunk)}. This looks like a bug, please file an issue at https://github.com/dariowho/intents")
+            utterance_data.append(render_chunk(chunk, service_names))
         utterances.append(af.DatasetIntentUtterance(
             data=utterance_data
         ))
@@ -79,9 +141,31 @@ def render_intent(
         utterances=utterances
     )
 
+def _render_text_chunk(
+    chunk: intent_language.TextUtteranceChunk,
+    service_names: LazyNames
+) -> af.DatasetIntentUtteranceTextSegment:
+    return af.DatasetIntentUtteranceTextSegment(chunk.text)
+
+def _render_entity_chunk(
+    chunk: intent_language.EntityUtteranceChunk,
+    service_names: LazyNames
+) -> af.DatasetIntentUtteranceEntitySegment:
+    return af.DatasetIntentUtteranceEntitySegment(
+        text=chunk.parameter_value,
+        entity=service_names[chunk.entity_cls],
+        slot_name=chunk.parameter_name
+    )
+
+_CHUNK_RENDERERS = {
+    intent_language.TextUtteranceChunk: _render_text_chunk,
+    intent_language.EntityUtteranceChunk: _render_entity_chunk
+}
+
 def render_all_entities(
     connector: SnipsConnector,
-    lang: LanguageCode
+    lang: LanguageCode,
+    service_names: LazyNames=None
 ) -> Dict[str, af.DatasetEntity]:
     """
     Render all entities in Agent. These are of three types:
@@ -93,56 +177,58 @@ def render_all_entities(
         * Can't be patched or replaced -> NotImplementedError
     * Custom entities
     """
+    if service_names is None:
+        service_names = _entity_service_names()
     result = {}
-    referenced_sys_entities = connector.agent_cls._referenced_sys_entities
+    referenced_sys_entities = frozenset(connector.agent_cls._referenced_sys_entities)
+    by_name = operator.attrgetter("name")
 
     # Custom Entities
-    entities = connector.agent_cls._entities_by_name.values()
-    result.update(ChainMap(*[render_entity(connector, e, lang) for e in entities]))
+    for entity_cls in connector.agent_cls._entities_by_name.values():
+        result.update(render_entity(connector, entity_cls, lang, service_names))
 
     # Snips-supported Sys entities
-    builtin_entities = [e for e in snips_entities.BUILTIN_ENTITIES]
-    builtin_entities = [e for e in builtin_entities if e in referenced_sys_entities]
-    for e in builtin_entities:
-        if not connector.entity_mappings.is_mapped(e, lang):
-            raise NotImplementedError(f"Agent references System Entity '{e}', but that is not "
+    builtin_entities = sorted(referenced_sys_entities.intersection(snips_entities.BUILTIN_ENTITIES), key=by_name)
+    for entity_cls in builtin_entities:
+        if not connector.entity_mappings.is_mapped(entity_cls, lang):
+            raise NotImplementedError(f"Agent references System Entity '{entity_cls}', but that is not "
                                       f"supported by Snips NLU for language '{lang}'")
-    result.update({snips_entities.ENTITY_MAPPINGS.service_name(e): {} for e in builtin_entities})
+        result[service_names[entity_cls]] = {}
 
     # Patched Sys entities
-    patched_mappings = [m for m in snips_entities.PATCHED_MAPPINGS]
-    patched_mappings = [m for m in patched_mappings if m.entity_cls in referenced_sys_entities]
+    patched_mappings = [m for m in snips_entities.PATCHED_MAPPINGS if m.entity_cls in referenced_sys_entities]
     if patched_mappings:
         logger.warning("[%s] The following entities are referenced by Agent, but are not supported natively by Snips: "
                        "%s. They have been patched with Intents builtin entities, which may not provide the "
                        "same quality as native service entities.", lang, [m.entity_cls.name for m in patched_mappings])
-        result.update(ChainMap(*[render_entity(connector, m.builtin_entity, lang) for m in patched_mappings]))
+        for m in patched_mappings:
+            result.update(render_entity(connector, m.builtin_entity, lang, service_names))
 
     # Placeholder entities
-    placeholder_entities = [e for e in snips_entities.PLACEHOLDER_ENTITIES]
-    placeholder_entities = [e for e in placeholder_entities if e in referenced_sys_entities]
+    placeholder_entities = sorted(referenced_sys_entities.intersection(snips_entities.PLACEHOLDER_ENTITIES), key=by_name)
     if placeholder_entities:
         logger.warning("[%s] The following entities are referenced by Agent, but are not supported natively by Snips: "
                        "%s. They have been replaced with empty placeholder entities, which is likely to lead to poor "
                        "prediction quality.", lang, [e.name for e in placeholder_entities])
-    result.update(ChainMap(*[render_placeholder_entity(connector, e) for e in placeholder_entities]))
-
-
+        for entity_cls in placeholder_entities:
+            result.update(render_placeholder_entity(connector, entity_cls, service_names))
 
     return result
 
 def render_entity(
     connector: SnipsConnector,
     entity_cls: Type[EntityMixin],
-    lang: LanguageCode
+    lang: LanguageCode,
+    service_names: LazyNames=None
 ) -> Dict[str, af.DatasetEntity]:
-    language_data = entity_language.entity_language_data(connector.agent_cls, entity_cls, lang)
-    language_data = language_data[lang]
+    language_data = entity_language.entity_language_data(connector.agent_cls, entity_cls, lang)[lang]
     entries = []
     for e in language_data:
         entries.append(af.DatasetEntityEntry(value=e.value, synonyms=e.synonyms))
     
-    service_name = snips_entities.ENTITY_MAPPINGS.service_name(entity_cls)
+    if service_names is None:
+        service_names = _entity_service_names()
+    service_name = service_names[entity_cls]
     return {
         service_name: af.DatasetEntity(
             data=entries,
@@ -155,8 +241,11 @@ def render_entity(
 def render_placeholder_entity(
     connector: SnipsConnector,
     entity_cls: str,
+    service_names: LazyNames=None
 ):
-    service_name = snips_entities.ENTITY_MAPPINGS.service_name(entity_cls)
+    if service_names is None:
+        service_names = _entity_service_names()
+    service_name = service_names[entity_cls]
     return {
         service_name: af.DatasetEntity(
             use_synonyms=True,
@@ -1,7 +1,6 @@
 import logging
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Type
-from collections import defaultdict
+from typing import Dict, List, Set, Tuple, Any, Type
 
 from intents import Intent, Agent, LanguageCode, FulfillmentContext, FulfillmentResult
 from intents.connectors.interface import deserialize_intent_parameters, Prediction, ServiceEntityMappings
@@ -23,9 +22,12 @@ class SnipsPredictionComponent:
     agent_cls: Type[Agent]
     entity_mappings: ServiceEntityMappings
 
+    _lang_cache: Dict[Tuple[Type[Intent], LanguageCode], intent_language.IntentLanguageData]
+
     def __init__(self, agent_cls: Type[Agent], entity_mappings: ServiceEntityMappings):
         self.agent_cls = agent_cls
         self.entity_mappings = entity_mappings
+        self._lang_cache = {}
 
     def intent_from_parse_result(self, parse_result: f.ParseResult) -> Intent:
         """
@@ -46,16 +48,7 @@ class SnipsPredictionComponent:
         Turn SnipsNLU output into a Prediction object
         """
         intent = self.intent_from_parse_result(parse_result)
-        language_data = intent_language.intent_language_data(self.agent_cls, intent.__class__, lang)
-        language_data = language_data[lang]
-        fulfillment_messages, fulfillment_text = intent_language.render_responses(intent, language_data)
-        return SnipsPrediction(
-            intent=intent,
-            confidence=parse_result.intent.probability,
-            fulfillment_messages=fulfillment_messages,
-            fulfillment_text=fulfillment_text,
-            parse_result=parse_result
-        )
+        return self._build_prediction(intent, parse_result.intent.probability, lang, parse_result)
 
     def prediction_from_intent(self, intent: Intent, lang: LanguageCode) -> SnipsPrediction:
         """
@@ -67,34 +60,85 @@ class SnipsPredictionComponent:
         Note that intent relations are not implemented yet. In the future, they must
         be solved as well.
         """
-        language_data = intent_language.intent_language_data(self.agent_cls, intent.__class__, lang)
-        language_data = language_data[lang]
+        return self._build_prediction(intent, 1.0, lang)
+
+    def predict_and_fulfill(self, parse_result: f.ParseResult, lang: LanguageCode) -> SnipsPrediction:
+        """
+        Turn SnipsNLU output into a Prediction object, and solve its fulfillment.
+        This is equivalent to calling :meth:`prediction_from_parse_result` and
+        :meth:`fulfill_local` in sequence.
+        """
+        intent = self.intent_from_parse_result(parse_result)
+        prediction = self._build_prediction(intent, parse_result.intent.probability, lang, parse_result)
+        return self.fulfill_local(prediction, lang)
+
+    def predict_batch(self, parse_results: List[f.ParseResult], lang: LanguageCode) -> List[SnipsPrediction]:
+        """
+        Same as :meth:`predict_and_fulfill`, for a list of SnipsNLU outputs in
+        the same language.
+        """
+        return [self.predict_and_fulfill(r, lang) for r in parse_results]
+
+    def _build_prediction(
+        self,
+        intent: Intent,
+        confidence: float,
+        lang: LanguageCode,
+        parse_result: f.ParseResult=None
+    ) -> SnipsPrediction:
+        language_data = self._get_language_data(intent.__class__, lang)
         fulfillment_messages, fulfillment_text = intent_language.render_responses(intent, language_data)
         return SnipsPrediction(
             intent=intent,
-            confidence=1.0,
+            confidence=confidence,
             fulfillment_messages=fulfillment_messages,
             fulfillment_text=fulfillment_text,
-            parse_result=None
+            parse_result=parse_result
         )
 
-    def fulfill_local(self, prediction: SnipsPrediction, lang: LanguageCode, _stack: List[str]=None) -> SnipsPrediction:
+    def _get_language_data(self, intent_cls: Type[Intent], lang: LanguageCode) -> intent_language.IntentLanguageData:
+        """
+        Language data is static for a given Agent: load it from resources the
+        first time an intent is predicted in a language, and cache it.
+        """
+        key = (intent_cls, lang)
+        language_data = self._lang_cache.get(key)
+        if language_data is None:
+            language_data = intent_language.intent_language_data(self.agent_cls, intent_cls, lang)[lang]
+            self._lang_cache[key] = language_data
+        return language_data
+
+    def cache_clear(self):
+        """
+        Forget cached language data, so that changes to language files are
+        picked up by the next predictions.
+        """
+        self._lang_cache.clear()
+
+    def fulfill_local(
+        self,
+        prediction: SnipsPrediction,
+        lang: LanguageCode,
+        _stack: List[str]=None,
+        _stack_set: Set[str]=None
+    ) -> SnipsPrediction:
         """
         Simulate the fulfillment flow in a local procedure. This method is called
         internally by :meth:`~SnipsConnector.predict` and
         :meth:`~SnipsConnector.trigger` to solve fulfillments before returning
         the Prediction to User.
 
-        Fulfillments are solved **recursively**, but at the moment loops are
-        not allowed: intent A can trigger intent B in fulfillment, but cannot
-        trigger itself. Intent B can trigger every other intent but A and B, and
-        so on.
+        Fulfillments are solved iteratively, one triggered intent at a time.
+        At the moment loops are not allowed: intent A can trigger intent B in
+        fulfillment, but cannot trigger itself. Intent B can trigger every other
+        intent but A and B, and so on.
 
         Args:
             prediction: A prediction object, as it is built before solving
                 fulfillment
             lang: Language code of the prediction
-            _stack: This is used internally to prevent loops in recursion
+            _stack: This is used internally to detect circular fulfillments
+            _stack_set: Same content as `_stack`, for constant time lookups
         Returns:
             The triggered intent that is returned by predicted
             :meth:`Intent.fulfill`. If :meth:`fulfill` is not defined, or if it
@@ -102,35 +146,42 @@ class SnipsPredictionComponent:
         """
         if not _stack:
             _stack = []
-    
-        if not prediction.intent:
-            logger.warning("Prediction contains no intent: %s", prediction)
-            return prediction
-
-        if prediction.intent.name in _stack:
-            raise RecursionError("Circular fulfillment calls detected: intent '%s' is being "
-                                 "fulfilled twice. Stack: %s. Make sure intents aren't fulfilled "
-                                 "recursively. If this is intended, open a feature request issue "
-                                 "on the Intents repository", prediction.intent.name, _stack)
-
-        _stack.append(prediction.intent.name)
-
-        context = FulfillmentContext(
-            confidence=prediction.confidence,
-            fulfillment_text=prediction.fulfillment_text,
-            fulfillment_messages=prediction.fulfillment_messages,
-            language=lang
-        )
-        fulfillment_result = FulfillmentResult.ensure(prediction.intent.fulfill(context))
-        if fulfillment_result:
-            if fulfillment_result.trigger:
-                triggered = self.prediction_from_intent(fulfillment_result.trigger, lang)
-                return self.fulfill_local(triggered, lang, _stack=_stack)
-            else:
+        if _stack_set is None:
+            _stack_set = set(_stack)
+
+        while True:
+            if not prediction.intent:
+                logger.warning("Prediction contains no intent: %s", prediction)
+                return prediction
+
+            if prediction.intent.name in _stack_set:
+                raise RecursionError(f"Circular fulfillment calls detected: intent '{prediction.intent.name}' "
+                                     f"is being fulfilled twice. Stack: {_stack}. Make sure intents aren't "
+                                     "fulfilled recursively. If this is intended, open a feature request "
+                                     "issue on the Intents repository")
+
+            # Skip context building for intents that don't override fulfill()
+            if type(prediction.intent).fulfill is Intent.fulfill:
+                return prediction
+
+            _stack.append(prediction.intent.name)
+            _stack_set.add(prediction.intent.name)
+
+            context = FulfillmentContext(
+                confidence=prediction.confidence,
+                fulfillment_text=prediction.fulfillment_text,
+                fulfillment_messages=prediction.fulfillment_messages,
+                language=lang
+            )
+            fulfillment_result = FulfillmentResult.ensure(prediction.intent.fulfill(context))
+            if not fulfillment_result:
+                return prediction
+            if not fulfillment_result.trigger:
                 logger.warning("Intent returned a fulfillment result without trigger. Trigger "
                                "is the only supported response in SnipsConnector. Other elements "
                                "will be ignored.")
-        return prediction
+                return prediction
+            prediction = self.prediction_from_intent(fulfillment_result.trigger, lang)
 
 def _slot_list_to_param_dict(
     intent_cls: Type[Intent],
@@ -141,29 +192,29 @@ def _slot_list_to_param_dict(
     entity can be tagged multiple times, result slots will contain more than one
     match for that entity, even if the slot is not meant to be a list. So here we:
 
-    * Collect matches per slot as lists
-    * Pick first element for non-list parameters
+    * Collect matches as lists for list parameters
+    * Pick the first match for non-list parameters
 
     The resulting parameter dict can be fed to
     :func:`deserialize_intent_parameters` without the risk of raising exceptions
     """
-    result_lists = defaultdict(list)
-    for slot in result_slots:
-        result_lists[slot.slotName].append(slot.value)
-
     result = {}
     schema = intent_cls.parameter_schema
-    for slot_name, slot_values in result_lists.items():
-        if slot_name not in schema:
-            raise KeyError(f"Slot {slot_name} not found in intent {intent_cls} with schema: "
-                        f"{schema}. Make sure your trained model is up to date with the "
-                        "latest Agent definition. If it is, please file a bug in the Intents "
-                        "repository")
-        if schema[slot_name].is_list:
-            result[slot_name] = slot_values
+    list_slots = frozenset(name for name, metadata in schema.items() if metadata.is_list)
+    for slot in result_slots:
+        slot_name = slot.slotName
+        if slot_name in list_slots:
+            result.setdefault(slot_name, []).append(slot.value)
+        elif slot_name in result:
+            logger.warning("Prediction returned more than one value for slot %s: %s. "
+                           "Only the first value will be considered.", slot_name, slot.value)
         else:
-            if len(slot_values) > 1:
-                logger.warning("Prediction returned more than one value for slot %s: %s. "
-                            "Only the first value will be considered.")
-            result[slot_name] = slot_values[0]
+            result[slot_name] = slot.value
+
+    unknown_slots = result.keys() - schema.keys()
+    if unknown_slots:
+        raise KeyError(f"Slots {sorted(unknown_slots)} not found in intent {intent_cls} with schema: "
+                       f"{schema}. Make sure your trained model is up to date with the "
+                       "latest Agent definition. If it is, please file a bug in the Intents "
+                       "repository")
     return result
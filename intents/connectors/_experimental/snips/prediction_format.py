@@ -1,18 +1,20 @@
+import sys
 from dataclasses import dataclass
 from typing import List
-import dacite
 
-@dataclass
+from intents.helpers.data_classes import DATACLASS_SLOTS
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ParseResultIntent:
     intentName: str
     probability: float
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ParseResultSlotRange:
     start: int
     end: int
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ParseResultSlot:
     range: ParseResultSlotRange
     rawValue: str
@@ -20,12 +22,32 @@ class ParseResultSlot:
     entity: str
     slotName: str
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ParseResult:
     input: str
     intent: ParseResultIntent
     slots: List[ParseResultSlot]
 
-def from_dict(parse_result: dict):
+def from_dict(parse_result: dict) -> ParseResult:
     # TODO: handle fallback (intentName=None)
-    return dacite.from_dict(ParseResult, parse_result)
+    # The schema is fixed: build dataclasses directly, rather than resolving
+    # type hints at every call (e.g. with `dacite`)
+    # Names are interned, as they are used as keys in Agent and schema lookups
+    intent = parse_result['intent']
+    intent_name = intent.get('intentName')
+    return ParseResult(
+        input=parse_result['input'],
+        intent=ParseResultIntent(
+            intentName=sys.intern(intent_name) if intent_name else None,
+            probability=intent.get('probability')
+        ),
+        slots=[
+            ParseResultSlot(
+                range=ParseResultSlotRange(start=s['range']['start'], end=s['range']['end']),
+                rawValue=s['rawValue'],
+                value=s['value'],
+                entity=s['entity'],
+                slotName=sys.intern(s['slotName'])
+            ) for s in parse_result['slots']
+        ]
+    )
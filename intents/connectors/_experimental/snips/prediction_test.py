@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from dataclasses import dataclass
 from typing import List
 
@@ -197,5 +197,58 @@ def test_fulfillment_recursion_is_blocked():
 
     prediction_component = prediction.SnipsPredictionComponent(MyAgent, entities.ENTITY_MAPPINGS)
     pred = prediction_component.prediction_from_intent(RecursiveFulfillmentIntent(), LanguageCode.ENGLISH)
-    with pytest.raises(RecursionError):
+    with pytest.raises(RecursionError, match="RecursiveFulfillmentIntent"):
         prediction_component.fulfill_local(pred, LanguageCode.ENGLISH)
+
+def test_fulfillment_chain():
+    @dataclass
+    class ChainIntentA(Intent):
+        def fulfill(self, context):
+            return ChainIntentB()
+
+    @dataclass
+    class ChainIntentB(Intent):
+        def fulfill(self, context):
+            return None
+
+    for intent_cls in [ChainIntentA, ChainIntentB]:
+        intent_cls.__intent_language_data__ = ca.mock_language_data(
+            intent_cls, [], ["fake response"], LanguageCode.ENGLISH
+        )
+
+    class MyAgent(Agent):
+        languages = ['en']
+    MyAgent.register(ChainIntentA)
+    MyAgent.register(ChainIntentB)
+
+    prediction_component = prediction.SnipsPredictionComponent(MyAgent, entities.ENTITY_MAPPINGS)
+    pred = prediction_component.prediction_from_intent(ChainIntentA(), LanguageCode.ENGLISH)
+    assert prediction_component.fulfill_local(pred, LanguageCode.ENGLISH).intent == ChainIntentB()
+
+def test_fulfillment_skipped_if_not_overridden():
+    prediction_component = _get_prediction_component()
+    pred = prediction_component.prediction_from_intent(ca.AskEspresso(), LanguageCode.ENGLISH)
+    with patch.object(prediction, "FulfillmentContext") as mock_context:
+        assert prediction_component.fulfill_local(pred, LanguageCode.ENGLISH) is pred
+        mock_context.assert_not_called()
+
+def test_language_data_is_cached(monkeypatch):
+    prediction_component = _get_prediction_component()
+    mock_language_data = MagicMock(wraps=prediction.intent_language.intent_language_data)
+    monkeypatch.setattr(prediction.intent_language, "intent_language_data", mock_language_data)
+    prediction_component.prediction_from_intent(ca.AskEspresso(roast="dark"), LanguageCode.ENGLISH)
+    prediction_component.prediction_from_intent(ca.AskEspresso(roast="medium"), LanguageCode.ENGLISH)
+    mock_language_data.assert_called_once_with(ca.CoffeeAgent, ca.AskEspresso, LanguageCode.ENGLISH)
+
+def test_slot_list_to_param_dict_unknown_slot():
+    slots = [
+        pf.ParseResultSlot(
+            range=pf.ParseResultSlotRange(start=0, end=4),
+            rawValue="dark",
+            value={'kind': 'Custom', 'value': 'dark'},
+            entity="CoffeeRoast",
+            slotName="not_a_parameter"
+        )
+    ]
+    with pytest.raises(KeyError):
+        prediction._slot_list_to_param_dict(ca.AskEspresso, slots)
@@ -1,3 +1,5 @@
+import os
+import functools
 from typing import Union
 
 import google.oauth2.service_account
@@ -11,12 +13,22 @@ def resolve_credentials(credentials_or_path: Union[str, Credentials]) -> Credent
     case, the JSON is read into an instance of
     :class:`google.oauth2.service_account.Credetials`
     (https://google-auth.readthedocs.io/en/latest/reference/google.oauth2.service_account.html)
+
+    Credentials that are read from file are cached: connectors that are built
+    with the same Service Account JSON will share the same object, unless the
+    file is modified in between.
     """
     if isinstance(credentials_or_path, Credentials):
         return credentials_or_path
 
     elif isinstance(credentials_or_path, str):
-        return google.oauth2.service_account.Credentials.from_service_account_file(credentials_or_path)
+        path = os.path.abspath(credentials_or_path)
+        return _credentials_from_file(path, os.path.getmtime(path))
         
     else:
         raise ValueError("Unsupported Dialogflow Credentials type. Please pass the path to a Service Account JSON, or an instance of google.auth.credentials.Credentials")
+
+@functools.lru_cache(maxsize=32)
+def _credentials_from_file(path: str, mtime: float) -> Credentials:
+    # `mtime` is only part of the cache key: a modified file is read again
+    return google.oauth2.service_account.Credentials.from_service_account_file(path)
@@ -0,0 +1,19 @@
+import os
+import tempfile
+from unittest.mock import patch
+
+from intents.connectors.dialogflow_es import auth
+
+@patch("google.oauth2.service_account.Credentials.from_service_account_file")
+def test_credentials_from_file_are_cached(mock_from_file):
+    mock_from_file.side_effect = lambda path: object()
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "credentials.json")
+        with open(path, "w") as f:
+            f.write("{}")
+        first = auth.resolve_credentials(path)
+        assert auth.resolve_credentials(path) is first
+        mock_from_file.assert_called_once_with(path)
+
+        os.utime(path, (0, 0))
+        assert auth.resolve_credentials(path) is not first
@@ -2,11 +2,13 @@
 Here we implement :class:`DialogflowEsConnector`, an implementation of
 :class:`Connector` that allows Agents to operate on Dialogflow ES.
 """
-import os
+import io
 import logging
-import tempfile
+import weakref
+import threading
+import functools
 from dataclasses import dataclass, field
-from typing import Set, Dict, Union, Iterable, Type
+from typing import Set, Dict, Union, Iterable, Type, Tuple, BinaryIO
 
 import google.auth.credentials
 from google.cloud.dialogflow_v2.types import TextInput, QueryInput, EventInput
@@ -15,8 +17,9 @@ from google.cloud.dialogflow_v2.services.agents import AgentsClient
 from google.cloud.dialogflow_v2 import types as pb
 
 from intents import Agent, Intent, LanguageCode, FulfillmentContext, FulfillmentResult
-from intents.model.relations import intent_relations
+from intents.model.relations import intent_relations, FollowIntentRelation
 from intents.language_codes import ensure_language_code
+from intents.helpers.misc import LazyNames
 from intents.connectors.interface import Connector, Prediction, FulfillmentRequest, WebhookConfiguration, deserialize_intent_parameters
 from intents.connectors.dialogflow_es.auth import resolve_credentials
 from intents.connectors.dialogflow_es.util import dict_to_protobuf
@@ -28,7 +31,18 @@ from intents.connectors.dialogflow_es.prediction import PredictionBody, DetectIn
 
 logger = logging.getLogger(__name__)
 
-RICH_RESPONSE_PLATFORMS = ["telegram", "facebook", "slack", "line", "hangouts"]
+# Query inputs are built as raw protobuf messages: the client accepts them as
+# they are, and proto-plus wrappers would marshal every field on construction
+_TextInputPb = TextInput.pb()
+_EventInputPb = EventInput.pb()
+_QueryInputPb = QueryInput.pb()
+
+# Sessions clients hold a gRPC channel, which is expensive to open: connectors
+# with the same credentials share one client while any of them is alive
+_SESSION_CLIENTS: "weakref.WeakValueDictionary[google.auth.credentials.Credentials, SessionsClient]" = weakref.WeakValueDictionary()
+_SESSION_CLIENTS_LOCK = threading.Lock()
+
+RICH_RESPONSE_PLATFORMS = frozenset({"telegram", "facebook", "slack", "line", "hangouts"})
 
 # Dialogflow makes use of Protobuffer for its data structures, and protobuf may be
 # tricky to deal with. For instance, `MessageToDict` will convert snake_case to
@@ -97,9 +111,14 @@ class DialogflowEsConnector(Connector):
     webhook_configuration: WebhookConfiguration
 
     _credentials: google.auth.credentials.Credentials
+    _project_id: str
+    _agent_name: str
     _session_client: SessionsClient
+    _agents_client: AgentsClient
     _need_context_set: Set[type(Intent)]
     _intents_by_context: Dict[str, type(Intent)]
+    _context_names: LazyNames
+    _event_names: LazyNames
 
     def __init__(
         self,
@@ -113,36 +132,46 @@ class DialogflowEsConnector(Connector):
         super().__init__(agent_cls, default_session=default_session,
                          default_language=default_language)
         self._credentials = resolve_credentials(google_credentials)
-        assert all([p in RICH_RESPONSE_PLATFORMS for p in rich_platforms])
-        self._session_client = SessionsClient(credentials=self._credentials)
+        self._project_id = self._credentials.project_id
+        self._agent_name = 'py-' + agent_cls.__name__
+        rich_platforms = tuple(rich_platforms)
+        unsupported_platforms = set(rich_platforms) - RICH_RESPONSE_PLATFORMS
+        if unsupported_platforms:
+            raise ValueError(f"Unsupported rich platforms: {sorted(unsupported_platforms)}. " +
+                             f"Supported platforms are: {sorted(RICH_RESPONSE_PLATFORMS)}")
+        with _SESSION_CLIENTS_LOCK:
+            self._session_client = _SESSION_CLIENTS.get(self._credentials)
+            if self._session_client is None:
+                self._session_client = SessionsClient(credentials=self._credentials)
+                _SESSION_CLIENTS[self._credentials] = self._session_client
+        self._agents_client = None
         self.rich_platforms = rich_platforms
         self.webhook_configuration = webhook_configuration
         self._need_context_set = _build_need_context_set(agent_cls)
         self._intents_by_context = _build_intents_by_context(agent_cls)
+        self._context_names = LazyNames(df_names.context_name, agent_cls.intents)
+        self._event_names = LazyNames(df_names.event_name, agent_cls.intents)
 
     @property
     def gcp_project_id(self) -> str:
         """
         Return the Google Cloud Project ID that is associated with the current Connection
         """
-        return self._credentials.project_id
+        return self._project_id
 
-    def export(self, destination: str):
-        agent_name = 'py-' + self.agent_cls.__name__
-        return df_export.export(self, destination, agent_name)
+    def export(self, destination: Union[str, BinaryIO]):
+        return df_export.export(self, destination, self._agent_name)
 
     def upload(self):
-        agents_client = AgentsClient(credentials=self._credentials)
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            export_path = os.path.join(tmp_dir, 'agent.zip')
-            self.export(export_path)
-            with open(export_path, 'rb') as f:
-                agent_content = f.read()
-            restore_request = pb.RestoreAgentRequest(
-                parent=f"projects/{self.gcp_project_id}",
-                agent_content=agent_content
-            )
-            agents_client.restore_agent(request=restore_request)
+        if self._agents_client is None:
+            self._agents_client = AgentsClient(credentials=self._credentials)
+        agent_zip = io.BytesIO()
+        self.export(agent_zip)
+        restore_request = pb.RestoreAgentRequest(
+            parent=f"projects/{self._project_id}",
+            agent_content=agent_zip.getvalue()
+        )
+        self._agents_client.restore_agent(request=restore_request)
 
     def predict(self, message: str, session: str = None, language: Union[LanguageCode, str] = None) -> DialogflowPrediction:
         if not session:
@@ -151,10 +180,9 @@ class DialogflowEsConnector(Connector):
             language = self.default_language
 
         language = ensure_language_code(language)
-        text_input = TextInput(text=message, language_code=language.value)
-        query_input = QueryInput(text=text_input)
-        session_path = self._session_client.session_path(
-            self.gcp_project_id, session)
+        text_input = _TextInputPb(text=message, language_code=language.value)
+        query_input = _QueryInputPb(text=text_input)
+        session_path = _session_path(self._project_id, session)
         df_result = self._session_client.detect_intent(
             session=session_path,
             query_input=query_input
@@ -171,7 +199,7 @@ class DialogflowEsConnector(Connector):
 
         language = ensure_language_code(language)
         intent_name = intent.name
-        event_name = df_names.event_name(intent.__class__)
+        event_name = self._event_names[intent.__class__]
         event_parameters = {}
         for param_name, param_metadata in intent.parameter_schema.items():
             param_mapping = df_entities.MAPPINGS[param_metadata.entity_cls]
@@ -181,17 +209,14 @@ class DialogflowEsConnector(Connector):
 
         logger.info("Triggering event '%s' in session '%s' with parameters: %s",
                     event_name, session, event_parameters)
-        if not event_parameters:
-            event_parameters = {}
 
-        event_input = EventInput(
+        event_input = _EventInputPb(
             name=event_name,
-            parameters=dict_to_protobuf(event_parameters),
+            parameters=dict_to_protobuf(event_parameters) if event_parameters else None,
             language_code=language.value
         )
-        query_input = QueryInput(event=event_input)
-        session_path = self._session_client.session_path(
-            self.gcp_project_id, session)
+        query_input = _QueryInputPb(event=event_input)
+        session_path = _session_path(self._project_id, session)
         df_result = self._session_client.detect_intent(
             session=session_path,
             query_input=query_input
@@ -210,12 +235,13 @@ class DialogflowEsConnector(Connector):
             return webhook.fulfillment_result_to_response(fulfillment_result, context)
         return {}
 
-    def _df_body_to_fulfillment_context(self, df_body: DetectIntentBody) -> DialogflowPrediction:
+    def _df_body_to_fulfillment_context(self, df_body: PredictionBody) -> FulfillmentContext:
+        query_result = df_body.queryResult
         return FulfillmentContext(
-            confidence=df_body.queryResult.intentDetectionConfidence,
+            confidence=query_result.intentDetectionConfidence,
             fulfillment_messages=intent_responses(df_body),
-            fulfillment_text=df_body.queryResult.fulfillmentText,
-            language=LanguageCode(df_body.queryResult.languageCode)
+            fulfillment_text=query_result.fulfillmentText,
+            language=LanguageCode(query_result.languageCode)
         )
 
     def _df_body_to_prediction(self, df_body: DetectIntentBody) -> DialogflowPrediction:
@@ -237,12 +263,12 @@ class DialogflowEsConnector(Connector):
         Convert a Dialogflow prediction response into an instance of
         :class:`Intent`.
         
-        This method is recursive on intent relations. When an intent has a
+        Intent relations are resolved here too. When an intent has a
         :meth:`~intents.model.relations.follow` field, that field must be filled
-        with an instance of the followed intent; in this case
-        :meth:`_df_body_to_intent` will call itself passing the parent intent
-        class as `build_related_cls`, to force building that intent from the
-        same `df_body`; contexts and parameters will be checked for consistency.
+        with an instance of the followed intent, that is built from the same
+        `df_body`; contexts and parameters will be checked for consistency.
+        Relations are walked depth-first with an explicit stack, and related
+        intents are built before the ones that follow them.
 
         Args:
             df_body: A Dialogflow Response
@@ -253,8 +279,6 @@ class DialogflowEsConnector(Connector):
         if not visited_intents:
             visited_intents = set()
 
-        contexts, context_parameters = df_body.contexts()
-
         # Slot filling in progress
         # TODO: also check queryResult.cancelsSlotFilling
         # if "__system_counters__" in contexts:
@@ -264,42 +288,67 @@ class DialogflowEsConnector(Connector):
                            "Intent object will be None")
             return None
 
+        contexts, context_parameters = df_body.contexts()
+
         if build_related_cls:
-            # TODO: adjust lifespan
-            intent_cls = build_related_cls
-            df_parameters = {
-                p_name: p.value for p_name, p in context_parameters.items() 
-                if p_name in intent_cls.parameter_schema
-            }
+            root_cls = build_related_cls
+            root_parameters = None
         else:
             intent_name = df_body.intent_name
-            intent_cls: Intent = self.agent_cls._intents_by_name.get(intent_name)
-            if not intent_cls:
+            root_cls: Intent = self.agent_cls._intents_by_name.get(intent_name)
+            if not root_cls:
                 raise ValueError(f"Prediction returned intent '{intent_name}', " +
                     "but this was not found in Agent definition. Make sure to restore a latest " +
                     "Agent export from `services.dialogflow_es.export.export()`. If the problem " +
                     "persists, please file a bug on the Intents repository.")
-            df_parameters = df_body.intent_parameters
-
-        visited_intents.add(intent_cls)
-        parameter_dict = deserialize_intent_parameters(df_parameters, intent_cls, self.entity_mappings)
-        related_intents_dict = {}
-        for rel in intent_relations(intent_cls).follow:
-            if rel.target_cls in visited_intents:
-                raise ValueError(f"Loop detected: {rel.target_cls} was already visited. Make sure "
-                                 "your Agent has no circular dependencies")
-            related_intent = self._df_body_to_intent(df_body, rel.target_cls, visited_intents)
-            related_intent.lifespan = df_body.context_lifespans.get(df_names.context_name(rel.target_cls), 0)
-            
-            related_intents_dict[rel.field_name] = related_intent
-
-        result = intent_cls(**parameter_dict, **related_intents_dict)
-        result.lifespan = df_body.context_lifespans.get(df_names.context_name(intent_cls), 0)
-        return result
+            root_parameters = df_body.intent_parameters
+
+        # Each frame is (intent class, field name in the parent intent,
+        # relations left to visit, related intents built so far)
+        visited_intents.add(root_cls)
+        stack = [(root_cls, None, iter(_follow_relations(root_cls)), {})]
+        while True:
+            intent_cls, field_name, relations, related_intents_dict = stack[-1]
+            rel = next(relations, None)
+            if rel:
+                if rel.target_cls in visited_intents:
+                    raise ValueError(f"Loop detected: {rel.target_cls} was already visited. Make sure "
+                                     "your Agent has no circular dependencies")
+                visited_intents.add(rel.target_cls)
+                stack.append((rel.target_cls, rel.field_name, iter(_follow_relations(rel.target_cls)), {}))
+                continue
+
+            stack.pop()
+            if stack or root_parameters is None:
+                # TODO: adjust lifespan
+                df_parameters = {
+                    p_name: p.value for p_name, p in context_parameters.items()
+                    if p_name in intent_cls.parameter_schema
+                }
+            else:
+                df_parameters = root_parameters
+
+            parameter_dict = deserialize_intent_parameters(df_parameters, intent_cls, self.entity_mappings)
+            result = intent_cls(**parameter_dict, **related_intents_dict)
+            result.lifespan = df_body.context_lifespans.get(self._context_names[intent_cls], 0)
+            if not stack:
+                return result
+            stack[-1][3][field_name] = result
 
     def _intent_needs_context(self, intent: Intent) -> bool:
         return intent in self._need_context_set
 
+@functools.lru_cache(maxsize=1024)
+def _session_path(project_id: str, session: str) -> str:
+    # Sessions are typically reused for many requests: format their path once
+    return SessionsClient.session_path(project_id, session)
+
+@functools.lru_cache(maxsize=None)
+def _follow_relations(intent_cls: Type[Intent]) -> Tuple[FollowIntentRelation, ...]:
+    # Relations are defined by the class: walk its fields once. Followed intents
+    # are not necessarily registered in the Agent, so this is not keyed on it
+    return tuple(intent_relations(intent_cls).follow)
+
 def _build_need_context_set(agent_cls: type(Agent)) -> Set[Intent]:
     """
     Return a list of intents that need to spawn a context, based on their
@@ -309,8 +358,7 @@ def _build_need_context_set(agent_cls: type(Agent)) -> Set[Intent]:
     """
     result = set()
     for intent in agent_cls.intents:
-        related = intent_relations(intent)
-        for rel in related.follow:
+        for rel in _follow_relations(intent):
             result.add(rel.target_cls)
     return result
 
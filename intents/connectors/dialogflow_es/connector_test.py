@@ -202,3 +202,17 @@ def test_calculator_is_fulfilled(self):
     assert response == expected
 
     assert MockSolveMathOperation._test_call_count == 1
+
+@patch("intents.connectors.dialogflow_es.connector.resolve_credentials")
+@patch("intents.connectors.dialogflow_es.connector.SessionsClient")
+def test_unsupported_rich_platform(*args):
+    with pytest.raises(ValueError):
+        DialogflowEsConnector('/fake/path/to/credentials.json', ExampleAgent, rich_platforms=["telegram", "myspace"])
+
+@patch("intents.connectors.dialogflow_es.connector.resolve_credentials")
+@patch("intents.connectors.dialogflow_es.connector.SessionsClient")
+def test_session_client_is_shared(mock_df_client_class, mock_resolve_credentials):
+    df_1 = DialogflowEsConnector('/fake/path/to/credentials.json', ExampleAgent)
+    df_2 = DialogflowEsConnector('/fake/path/to/credentials.json', coffee_agent.CoffeeAgent)
+    assert df_1._session_client is df_2._session_client
+    mock_df_client_class.assert_called_once()
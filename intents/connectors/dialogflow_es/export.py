@@ -1,16 +1,14 @@
 """
 Here we export a :class:`Agent` to Dialogflow format.
 """
-import os
 import json
-import shutil
 import logging
-import tempfile
+import zipfile
 from uuid import uuid1
-from dataclasses import asdict
-from typing import List, Dict, Set, Iterable, Type
+from typing import List, Dict, Set, Iterable, Type, Union, BinaryIO
 
 from intents import Intent, EntityMixin, language
+from intents.helpers.data_classes import dataclass_json_default
 from intents.model.relations import intent_relations, FollowIntentRelation
 import intents.connectors.dialogflow_es.agent_format as df
 import intents.connectors.dialogflow_es.names as df_names
@@ -18,63 +16,60 @@ from intents.connectors.dialogflow_es.entities import MAPPINGS as ENTITY_MAPPING
 
 logger = logging.getLogger(__name__)
 
-def export(connector: "intents.DialogflowEsConnector", output_path: str, agent_name="py-agent") -> None:
+def export(connector: "intents.DialogflowEsConnector", output: Union[str, BinaryIO], agent_name="py-agent") -> None:
     """
-    Export the given agent to the given path
+    Export the given agent as a Dialogflow zip archive. Files are rendered in
+    memory and written straight into the archive.
+
+    Args:
+        connector: The Connector of the Agent to export
+        output: Path of the zip file (`.zip` is appended if missing), or a
+            binary file object, such as :class:`io.BytesIO`
+        agent_name: Name of the Dialogflow Agent
     """
     agent_cls = connector.agent_cls
 
-    output_dir = os.path.join(tempfile.gettempdir(), 'dialogflow-agents-export', agent_name)
-    intents_dir = os.path.join(output_dir, 'intents')
-    entities_dir = os.path.join(output_dir, 'entities')
+    if isinstance(output, str) and not output.endswith('.zip'):
+        output += '.zip'
 
-    if os.path.isdir(intents_dir):
-        logger.warning("Removing existing intents folder: %s", intents_dir)
-        shutil.rmtree(intents_dir)
+    with zipfile.ZipFile(output, 'w', zipfile.ZIP_DEFLATED) as zf:
+        _write_zip_dir(zf, 'intents/')
+        _write_zip_dir(zf, 'entities/')
 
-    if os.path.isdir(entities_dir):
-        logger.warning("Removing existing entities folder: %s", entities_dir)
-        shutil.rmtree(entities_dir)
-
-    os.makedirs(intents_dir)
-    os.makedirs(entities_dir)
-
-    with open(os.path.join(output_dir, 'agent.json'), 'w') as f:
         languages = agent_cls.languages
-        json.dump(asdict(render_agent(connector, agent_name, languages)), f, indent=2)
-
-    with open(os.path.join(output_dir, 'package.json'), 'w') as f:
-        json.dump({"version": "1.0.0"}, f, indent=2)
-
-    for intent in agent_cls.intents:
-        language_data = language.intent_language_data(agent_cls, intent)
-        rendered_intent = render_intent(connector, intent, language_data)
-        with open(os.path.join(intents_dir, f"{intent.name}.json"), "w") as f:
-            json.dump(asdict(rendered_intent), f, indent=2)
-        
-        for language_code, language_code_data in language_data.items():
-            rendered_intent_usersays = render_intent_usersays(agent_cls, intent, language_code, language_code_data.example_utterances)
-            filename = f"{intent.name}_usersays_{language_code.value}.json"
-            with open(os.path.join(intents_dir, filename), "w") as f:
-                usersays_data = [asdict(x) for x in rendered_intent_usersays]
-                json.dump(usersays_data, f, indent=2)
-
-    for entity_cls in agent_cls._entities_by_name.values():
-        language_data = language.entity_language_data(agent_cls, entity_cls)
-        rendered_entity = render_entity(entity_cls)
-        with open(os.path.join(entities_dir, f"{entity_cls.name}.json"), "w") as f:
-            json.dump(asdict(rendered_entity), f, indent=2)
-
-        for language_code, entries in language_data.items():
-            rendered_entity_entries = render_entity_entries(agent_cls, entries)
-            filename = f"{entity_cls.name}_entries_{language_code.value}.json"
-            with open(os.path.join(entities_dir, filename), "w") as f:
-                entries_data = [asdict(x) for x in rendered_entity_entries]
-                json.dump(entries_data, f, indent=2)
-
-    if output_path.endswith('.zip'):
-        output_path = output_path[:-4]
-    shutil.make_archive(output_path, 'zip', output_dir)
+        _write_zip_json(zf, 'agent.json', render_agent(connector, agent_name, languages))
+        _write_zip_json(zf, 'package.json', {"version": "1.0.0"})
+
+        for intent in agent_cls.intents:
+            language_data = language.intent_language_data(agent_cls, intent)
+            rendered_intent = render_intent(connector, intent, language_data)
+            _write_zip_json(zf, f"intents/{intent.name}.json", rendered_intent)
+
+            for language_code, language_code_data in language_data.items():
+                rendered_intent_usersays = render_intent_usersays(agent_cls, intent, language_code, language_code_data.example_utterances)
+                filename = f"intents/{intent.name}_usersays_{language_code.value}.json"
+                _write_zip_json(zf, filename, rendered_intent_usersays)
+
+        for entity_cls in agent_cls._entities_by_name.values():
+            language_data = language.entity_language_data(agent_cls, entity_cls)
+            rendered_entity = render_entity(entity_cls)
+            _write_zip_json(zf, f"entities/{entity_cls.name}.json", rendered_entity)
+
+            for language_code, entries in language_data.items():
+                rendered_entity_entries = render_entity_entries(agent_cls, entries)
+                filename = f"entities/{entity_cls.name}_entries_{language_code.value}.json"
+                _write_zip_json(zf, filename, rendered_entity_entries)
+
+def _write_zip_json(zf: zipfile.ZipFile, arcname: str, data) -> None:
+    # Dataclasses are serialized as they are encountered, without deep-copying
+    # them to dicts first
+    zf.writestr(arcname, json.dumps(data, indent=2, default=dataclass_json_default))
+
+def _write_zip_dir(zf: zipfile.ZipFile, arcname: str) -> None:
+    # Explicit directory entries, like the ones `shutil.make_archive` writes
+    zinfo = zipfile.ZipInfo(arcname)
+    zinfo.external_attr = (0o40775 << 16) | 0x10
+    zf.writestr(zinfo, b'')
 
 #
 # Agent
@@ -1,4 +1,6 @@
+import io
 import os
+import zipfile
 import tempfile
 from unittest.mock import patch
 from dataclasses import dataclass
@@ -69,6 +71,14 @@ def test_export_example_agent_no_exceptions():
     with tempfile.TemporaryDirectory() as temp_dir:
         export.export(MockDialogflowConnector(ExampleAgent), os.path.join(temp_dir, 'TMP_AGENT.zip'))
 
+def test_export_to_file_object():
+    agent_zip = io.BytesIO()
+    export.export(MockDialogflowConnector(ExampleAgent), agent_zip)
+    with zipfile.ZipFile(agent_zip) as zf:
+        names = zf.namelist()
+        assert "agent.json" in names
+        assert all(f"intents/{i.name}.json" in names for i in ExampleAgent.intents)
+
 def test_get_input_contexts():
     mock_connector = MockDialogflowConnector(MockAgent)
     
@@ -94,7 +94,9 @@ class DetectIntentBody(PredictionBody):
     detect_intent: df.DetectIntentResponse
 
     def __init__(self, detect_intent_protobuf: pb.DetectIntentResponse):
-        detect_intent_dict = MessageToDict(detect_intent_protobuf._pb, including_default_value_fields=True)
+        # Read the raw protobuf message: proto-plus wrappers marshal every field access
+        raw_protobuf = type(detect_intent_protobuf).pb(detect_intent_protobuf)
+        detect_intent_dict = MessageToDict(raw_protobuf, including_default_value_fields=True)
         self.detect_intent = df.from_dict(
             data_class=df.DetectIntentResponse,
             data=detect_intent_dict,
@@ -18,6 +18,7 @@ from collections import defaultdict
 from abc import ABC, abstractmethod
 
 import dacite
+import proto
 from google.cloud.dialogflow_v2 import types as df_types
 from google.protobuf.json_format import MessageToDict
 
@@ -160,8 +161,7 @@ def from_protobuf(data_class: type, data):
     """
     Cast a protobuf structure to an equivalent dataclass type. We like dataclasses.
     """
-    if hasattr(data, "_pb"):
-        data_dict = MessageToDict(data._pb)
-    else:
-        data_dict = MessageToDict(data)
+    if isinstance(data, proto.Message):
+        data = type(data).pb(data)
+    data_dict = MessageToDict(data)
     return from_dict(data_class, data_dict)
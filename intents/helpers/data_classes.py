@@ -1,10 +1,16 @@
 """
 This module defines general purpose helpers that are used throughout the project
 """
+import sys
+import functools
 import dataclasses
 from enum import Enum
 from datetime import datetime
-from dataclasses import asdict, field
+from dataclasses import field
+
+# Keyword arguments to define slotted dataclasses, with `@dataclass(**DATACLASS_SLOTS)`.
+# The `slots` argument is only supported from Python 3.10.
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 class CustomFields(Enum):
     OMIT_NONE = "OMIT_NONE"
@@ -40,6 +46,104 @@ def custom_asdict_factory():
     
     return result_f
 
+def dataclass_json_default(obj):
+    """
+    A `default` hook for :func:`json.dumps`, that serializes dataclass objects
+    without converting them to dicts with :func:`asdict` first. This follows
+    the same conventions as :func:`custom_asdict_factory`, and it is mainly used
+    to write Connector schemas to JSON:
+
+    .. code-block:: python
+
+        json.dumps(dataclass_obj, default=dataclass_json_default)
+
+    Note that, unlike :func:`asdict`, nested values are not copied.
+    """
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        result = {}
+        for name in _field_names(type(obj)):
+            value = getattr(obj, name)
+            if value is not CustomFields.OMIT_NONE:
+                result[name] = value
+        return result
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, datetime):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def fast_dict(cls):
+    """
+    A class decorator that generates a `_to_dict()` method for the given
+    dataclass. The result is the same as :func:`asdict` with
+    :func:`custom_asdict_factory`, but fields are not looked up at every call:
+    conversion code is generated once, when the class is defined.
+
+    .. code-block:: python
+
+        @fast_dict
+        @dataclass
+        class MyDataclass:
+            foo: str
+            bar: List[MyOtherDataclass] = OmitNone()
+
+        MyDataclass("foo")._to_dict()    # {"foo": "foo"}
+
+    Nested dataclasses are converted with their own `_to_dict()`, if they define
+    one, or with :func:`to_dict` otherwise.
+    """
+    lines = ["def _to_dict(self):", "    result = {}"]
+    for f in dataclasses.fields(cls):
+        lines.append(f"    value = self.{f.name}")
+        lines.append("    if value is not OMIT_NONE:")
+        if f.type in _PRIMITIVE_TYPES:
+            lines.append(f"        result[{f.name!r}] = value if type(value) in PRIMITIVE_TYPES else convert(value)")
+        else:
+            lines.append(f"        result[{f.name!r}] = convert(value)")
+    lines.append("    return result")
+
+    namespace = {
+        "OMIT_NONE": CustomFields.OMIT_NONE,
+        "PRIMITIVE_TYPES": _PRIMITIVE_TYPES,
+        "convert": _to_dict_value
+    }
+    exec("\n".join(lines), namespace) # pylint: disable=exec-used
+    cls._to_dict = namespace["_to_dict"]
+    return cls
+
+_PRIMITIVE_TYPES = frozenset((str, int, float, bool, type(None)))
+
+def _to_dict_value(value):
+    value_type = type(value)
+    if value_type in _PRIMITIVE_TYPES:
+        return value
+    if value_type in (list, tuple):
+        return value_type(_to_dict_value(v) for v in value)
+    if value_type is dict:
+        return {k: _to_dict_value(v) for k, v in value.items()}
+    if hasattr(value_type, "_to_dict"):
+        return value._to_dict()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return str(value)
+    if dataclasses.is_dataclass(value):
+        return _dataclass_to_dict(value)
+    return value
+
+def _dataclass_to_dict(dataclass_obj):
+    result = {}
+    for name in _field_names(type(dataclass_obj)):
+        value = getattr(dataclass_obj, name)
+        if value is not CustomFields.OMIT_NONE:
+            result[name] = _to_dict_value(value)
+    return result
+
+@functools.lru_cache(maxsize=None)
+def _field_names(cls):
+    # Fields are fixed when the class is defined: no need to scan them every time
+    return tuple(f.name for f in dataclasses.fields(cls))
+
 def is_dataclass_strict(obj):
     """
     Like :func:`dataclasses.is_dataclass`, but return True only if the class
@@ -62,4 +166,14 @@ def is_dataclass_strict(obj):
     return dataclasses._FIELDS in cls.__dict__
 
 def to_dict(dataclass_obj):
-    return asdict(dataclass_obj, dict_factory=custom_asdict_factory())
+    """
+    Convert a dataclass object to a dict. The result is the same as
+    :func:`asdict` with :func:`custom_asdict_factory`, but the object tree is
+    walked directly: leaf values are not deep-copied, and classes decorated
+    with :func:`fast_dict` use their generated `_to_dict()`.
+    """
+    if isinstance(dataclass_obj, type) or not dataclasses.is_dataclass(dataclass_obj):
+        raise TypeError("to_dict() should be called on dataclass instances")
+    if hasattr(type(dataclass_obj), "_to_dict"):
+        return dataclass_obj._to_dict()
+    return _dataclass_to_dict(dataclass_obj)
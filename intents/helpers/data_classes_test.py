@@ -1,7 +1,9 @@
+import json
 from enum import Enum
+from typing import List
 from dataclasses import dataclass, asdict
 
-from intents.helpers.data_classes import custom_asdict_factory, OmitNone
+from intents.helpers.data_classes import custom_asdict_factory, OmitNone, dataclass_json_default, fast_dict, to_dict
 
 def test_custom_asdict_enums_are_converted():
     class ToyEnum(Enum):
@@ -58,3 +60,73 @@ def test_custom_asdict_omit_none_multiple():
     dc = ToyDataclassTwo()
     expected = {}
     assert asdict(dc, dict_factory=custom_asdict_factory()) == expected
+
+def test_dataclass_json_default_matches_custom_asdict():
+    class ToyEnum(Enum):
+        ONE = "one"
+        TWO = "two"
+
+    @dataclass
+    class ToyChild:
+        enum: ToyEnum
+        foo: str = OmitNone()
+
+    @dataclass
+    class ToyParent:
+        children: List[ToyChild]
+        child: ToyChild
+        bar: str = OmitNone()
+
+    dc = ToyParent([ToyChild(ToyEnum.ONE, "foo"), ToyChild(ToyEnum.TWO)], ToyChild(ToyEnum.ONE))
+    dc_json = json.dumps(dc, default=dataclass_json_default)
+    assert json.loads(dc_json) == asdict(dc, dict_factory=custom_asdict_factory())
+
+def test_fast_dict_matches_custom_asdict():
+    class ToyEnum(Enum):
+        ONE = "one"
+        TWO = "two"
+
+    @fast_dict
+    @dataclass
+    class ToyChild:
+        enum: ToyEnum
+        foo: str = OmitNone()
+
+    @dataclass
+    class ToyOtherChild:
+        enum: ToyEnum
+
+    @fast_dict
+    @dataclass
+    class ToyParent:
+        children: List[ToyChild]
+        other_child: ToyOtherChild
+        bar: str = OmitNone()
+
+    dc = ToyParent([ToyChild(ToyEnum.ONE, "foo"), ToyChild(ToyEnum.TWO)], ToyOtherChild(ToyEnum.ONE))
+    assert dc._to_dict() == asdict(dc, dict_factory=custom_asdict_factory())
+
+    dc = ToyParent([], ToyOtherChild(ToyEnum.TWO), "bar")
+    assert dc._to_dict() == asdict(dc, dict_factory=custom_asdict_factory())
+
+def test_to_dict_matches_custom_asdict():
+    class ToyEnum(Enum):
+        ONE = "one"
+        TWO = "two"
+
+    @dataclass
+    class ToyChild:
+        enum: ToyEnum
+        foo: str = OmitNone()
+
+    @dataclass
+    class ToyParent:
+        children: List[ToyChild]
+        mapping: dict
+        bar: str = OmitNone()
+
+    dc = ToyParent([ToyChild(ToyEnum.ONE, "foo"), ToyChild(ToyEnum.TWO)], {"a": [1, 2]})
+    assert to_dict(dc) == asdict(dc, dict_factory=custom_asdict_factory())
+
+    dc = ToyParent([], {}, "bar")
+    assert to_dict(dc) == asdict(dc, dict_factory=custom_asdict_factory())
@@ -1,4 +1,5 @@
 import re
+from typing import Any, Callable, Hashable, Iterable
 
 def camel_to_snake_case(name: str) -> str:
     """
@@ -14,3 +15,27 @@ def camel_to_snake_case(name: str) -> str:
     name = re.sub('__([A-Z])', r'_\1', name)
     name = re.sub('([a-z0-9])([A-Z])', r'\1_\2', name)
     return name.lower()
+
+class LazyNames(dict):
+    """
+    A dict of names that are derived from their keys (e.g. the service name of
+    an Entity class). A name is computed with `name_fn` the first time its key
+    is looked up, and then reused.
+
+    >>> names = LazyNames(lambda cls: cls.__name__.lower(), [int])
+    >>> names[str]
+    'str'
+
+    Args:
+        name_fn: The function that computes the name of a key
+        keys: Keys to name upfront
+    """
+    def __init__(self, name_fn: Callable[[Hashable], Any], keys: Iterable[Hashable]=()):
+        super().__init__()
+        self.name_fn = name_fn
+        for key in keys:
+            self[key] = name_fn(key)
+
+    def __missing__(self, key: Hashable) -> Any:
+        result = self[key] = self.name_fn(key)
+        return result
@@ -0,0 +1,14 @@
+from intents.helpers.misc import LazyNames
+
+def test_lazy_names():
+    calls = []
+    def name_fn(key):
+        calls.append(key)
+        return key.upper()
+
+    names = LazyNames(name_fn, ["a"])
+    assert calls == ["a"]
+    assert names["b"] == "B"
+    assert names["b"] == "B"
+    assert names["a"] == "A"
+    assert calls == ["a", "b"]
@@ -103,7 +103,7 @@ class ExampleUtterance(str):
     # TODO: check for escape characters - intent is possibly intent_cls
     def __init__(self, example: str, intent: Intent):
         self._intent = intent
-        self.chunks() # Will check parameters
+        self._chunks = self._parse_chunks() # Will check parameters
     
     def __new__(cls, example: str, intent: Intent):
         return super().__new__(cls, example)
@@ -121,10 +121,16 @@ class ExampleUtterance(str):
             TextUtteranceChunk(text="!")
         ]
 
+        Chunks are parsed once, when the utterance is created: the same list is
+        returned at every call, and it should not be modified.
+
         .. warning::
 
             This method doesn't handle escaping yet.
         """
+        return self._chunks
+
+    def _parse_chunks(self) -> List[UtteranceChunk]:
         # TODO: handle escaping
         parameter_schema = self._intent.parameter_schema
         result = []
@@ -226,6 +232,8 @@ class IntentResponse:
                 result_args[field_name] = self.__dict__[field_name]
         return self.__class__(**result_args)
 
+RE_RESPONSE_PARAMETERS = re.compile(r"(?:(?<=[^\w])|^)\$(?P<parameter_name>\w+)(?:(?=[^\w])|$)")
+
 def _render_response(data: Union[str, list], parameter_dict: Dict[str, str]):
     """
     Render some response data by replacing parameter references with the one contained in `parameter_dict`. This
@@ -235,11 +243,17 @@ def _render_response(data: Union[str, list], parameter_dict: Dict[str, str]):
         return data
         
     if isinstance(data, str):
-        result = data
-        for k, v in parameter_dict.items():
-            # result = result.replace(f"${k}", str(v))  # TODO: handle escaping
-            result = re.sub(r"(?:(?<=[^\w])|^)\$%s(?:(?=[^\w])|$)" % k, str(v), result)
-        return result
+        # TODO: handle escaping
+        if "$" not in data:
+            return data
+
+        def _replace(match: re.Match) -> str:
+            parameter_name = match.group("parameter_name")
+            if parameter_name in parameter_dict:
+                return str(parameter_dict[parameter_name])
+            return match.group(0)
+
+        return RE_RESPONSE_PARAMETERS.sub(_replace, data)
 
     if isinstance(data, list):
         return [_render_response(x, parameter_dict) for x in data]
@@ -60,6 +60,12 @@ def test_text_response_render():
 
     assert text_response_instance.render(fake_intent) == expected
 
+def test_text_response_render_value_is_not_a_pattern():
+    text_response_instance = TextIntentResponse(["It's $foo, not $bar", "No references here"])
+    fake_intent = FakeIntent(foo=r"C:\1\Users")
+    expected = TextIntentResponse([r"It's C:\1\Users, not $bar", "No references here"])
+    assert text_response_instance.render(fake_intent) == expected
+
 def test_quick_replies_response_string():
     quick_replies_instance = QuickRepliesIntentResponse(["ciao"])
     quick_replies_from_yaml = QuickRepliesIntentResponse.from_yaml("ciao")
@@ -1,3 +1,4 @@
+import functools
 from enum import Enum
 from typing import Union
 
@@ -71,4 +72,11 @@ def ensure_language_code(lang: Union[LanguageCode, str]) -> LanguageCode:
     """
     if isinstance(lang, LanguageCode):
         return lang
+    if isinstance(lang, str):
+        return _language_code_from_str(lang)
+    return LanguageCode(lang)
+
+@functools.lru_cache(maxsize=64)
+def _language_code_from_str(lang: str) -> LanguageCode:
+    # Few distinct strings are used in practice: skip Enum lookup for repeated ones
     return LanguageCode(lang)
@@ -2,6 +2,8 @@ import os
 import tempfile
 from unittest.mock import patch
 
+import pytest
+
 from intents import Agent
 from intents import language
 
@@ -63,4 +65,12 @@ def test_intent_data_all_languages():
 #     ...
 
 # def test_intent_data_rich_response_group():
-#     ...
\ No newline at end of file
+#     ...
+def test_ensure_language_code():
+    assert language.ensure_language_code("en") == language.LanguageCode.ENGLISH
+    assert language.ensure_language_code("en") is language.LanguageCode.ENGLISH
+    assert language.ensure_language_code(language.LanguageCode.ITALIAN) is language.LanguageCode.ITALIAN
+    with pytest.raises(ValueError):
+        language.ensure_language_code("not-a-language")
+    with pytest.raises(ValueError):
+        language.ensure_language_code(["en"])
@@ -7,6 +7,7 @@ Once the Agent is defined, you will connect it to a cloud service with a
 :class:`Connector`, to make prediction and trigger requests.
 """
 import re
+import sys
 import logging
 from types import ModuleType
 from dataclasses import dataclass
@@ -175,7 +176,7 @@ class Agent(metaclass=AgentType):
             cls._register_entity(param_metadata.entity_cls, param_name, intent_cls.name)
 
         cls.intents.append(intent_cls)
-        cls._intents_by_name[intent_cls.name] = intent_cls
+        cls._intents_by_name[sys.intern(intent_cls.name)] = intent_cls
         cls._intents_by_norm_name[norm_name] = intent_cls
 
     @classmethod
@@ -136,6 +136,16 @@ class IntentType(type):
 
     @property
     def parameter_schema(cls) -> Dict[str, IntentParameterMetadata]:
+        # Schema is built on first access, when the class is already decorated
+        # as a dataclass. Only `cls.__dict__` is checked, so that subclasses
+        # don't reuse the schema of their parent.
+        result = cls.__dict__.get("_parameter_schema")
+        if result is None:
+            result = cls._build_parameter_schema()
+            cls._parameter_schema = result
+        return result
+
+    def _build_parameter_schema(cls) -> Dict[str, IntentParameterMetadata]:
         if cls is Intent:
             return {}
 
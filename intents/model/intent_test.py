@@ -77,6 +77,21 @@ def test_parameter_schema_class_property():
     intent_instance = intent_with_params(required_param=None, required_list_param=None)
     assert intent_with_params.parameter_schema == intent_instance.parameter_schema
 
+def test_parameter_schema_is_cached_per_class():
+    @dataclass
+    class parent_intent(Intent):
+        """Intent with parameters"""
+        parent_param: Sys.Person
+
+    @dataclass
+    class child_intent(parent_intent):
+        """Intent with more parameters"""
+        child_param: Sys.Person = "John"
+
+    assert parent_intent.parameter_schema is parent_intent.parameter_schema
+    assert list(parent_intent.parameter_schema) == ["parent_param"]
+    assert list(child_intent.parameter_schema) == ["parent_param", "child_param"]
+
 def test_parameter_schema_skips_related_intents():
     class PaymentMethod(Entity):
         pass